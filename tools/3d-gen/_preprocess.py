@@ -0,0 +1,106 @@
+"""
+On-device TripoSG image preprocessing.
+
+CUDA counterpart of server._prepare_image + the DINOv2 feature extractor:
+matte → crop to foreground → pad to square → composite onto the background
+→ PREPARED_SIDE² (512) → DINOv2 resize/crop/normalize, all as GPU tensor ops.
+
+The crop + pad + resize is expressed as one affine grid_sample into a fixed
+side×side output, with the foreground box found by masked min/max instead of
+nonzero(), so forward() has no data-dependent shapes: it compiles once
+(dynamic over the input H×W only) and always emits the same (3, C, C) tensor
+regardless of upload size. Imported lazily — requires torch.
+"""
+
+import torch
+import torch.nn.functional as F
+from torch import nn
+
+
+class Preprocess(nn.Module):
+    """(H, W, 4) uint8 RGBA + (H, W) alpha on device → (3, C, C) DINOv2 pixel values."""
+
+    def __init__(
+        self,
+        feature_extractor,
+        side: int = 512,
+        padding_ratio: float = 0.1,
+        bg_color: tuple[float, float, float] = (1.0, 1.0, 1.0),
+    ):
+        super().__init__()
+        self.side = side
+        self.pad_scale = 1.0 + 2.0 * padding_ratio
+
+        # Mirror the pipeline's image processor so its own pass can be skipped
+        size = feature_extractor.size
+        self.resize_to = size.get("shortest_edge") or size["height"]
+        self.crop_to = (
+            feature_extractor.crop_size["height"]
+            if getattr(feature_extractor, "do_center_crop", False)
+            else self.resize_to
+        )
+        self.register_buffer("bg", torch.tensor(bg_color).view(3, 1, 1), persistent=False)
+        self.register_buffer(
+            "mean", torch.tensor(feature_extractor.image_mean).view(3, 1, 1), persistent=False
+        )
+        self.register_buffer(
+            "std", torch.tensor(feature_extractor.image_std).view(3, 1, 1), persistent=False
+        )
+
+    @torch.no_grad()
+    def matte(self, rgba: torch.Tensor, rmbg_net) -> torch.Tensor:
+        """(H, W) alpha in [0, 1]: the image's own, if it separates anything, else RMBG-1.4.
+
+        Not compiled — the branch costs one host sync, but skips an RMBG
+        forward for uploads that already carry a usable alpha channel.
+        """
+        fg = (rgba[..., 3] >= 128).float().mean().item()
+        if 0.01 <= fg <= 0.99:
+            return rgba[..., 3].float() / 255.0
+
+        # RMBG-1.4: 1024² input, mean 0.5, std 1.0; min-max normalized output
+        x = rgba[..., :3].permute(2, 0, 1).unsqueeze(0).float() / 255.0
+        x = F.interpolate(x, size=(1024, 1024), mode="bilinear") - 0.5
+        pred = rmbg_net(x)[0][0]
+        pred = F.interpolate(pred, size=rgba.shape[:2], mode="bilinear")[0, 0]
+        return (pred - pred.min()) / (pred.max() - pred.min() + 1e-8)
+
+    @torch.no_grad()
+    def forward(self, rgba: torch.Tensor, alpha: torch.Tensor) -> torch.Tensor:
+        H, W = alpha.shape
+        device = alpha.device
+        ys = torch.arange(H, device=device)
+        xs = torch.arange(W, device=device)
+
+        # Foreground box as first/last occupied row and column; whole image if empty
+        fg = alpha > 0.5
+        rows, cols = fg.any(dim=1), fg.any(dim=0)
+        empty = ~rows.any()
+        y0 = torch.where(empty, 0, torch.where(rows, ys, H).min())
+        y1 = torch.where(empty, H - 1, torch.where(rows, ys, -1).max())
+        x0 = torch.where(empty, 0, torch.where(cols, xs, W).min())
+        x1 = torch.where(empty, W - 1, torch.where(cols, xs, -1).max())
+
+        # Zero alpha outside the box (matches crop-then-pad), premultiply color
+        inside = ((ys >= y0) & (ys <= y1))[:, None] & ((xs >= x0) & (xs <= x1))[None, :]
+        a = alpha * inside
+        rgb = rgba[..., :3].permute(2, 0, 1).float() / 255.0
+        src = torch.cat([rgb * a, a[None]], dim=0)[None]
+
+        # Padded square centred on the box, sampled straight into side × side
+        span = torch.maximum(y1 - y0 + 1, x1 - x0 + 1).float() * self.pad_scale
+        t = (torch.arange(self.side, device=device) + 0.5) / self.side - 0.5
+        gy = ((y0 + y1 + 1).float() / 2 + t * span) / H * 2 - 1
+        gx = ((x0 + x1 + 1).float() / 2 + t * span) / W * 2 - 1
+        grid = torch.stack(torch.meshgrid(gx, gy, indexing="xy"), dim=-1)[None]
+        out = F.grid_sample(src, grid, mode="bilinear", padding_mode="zeros", align_corners=False)[0]
+        img = out[:3] + self.bg * (1.0 - out[3:])
+
+        # DINOv2 processor: bicubic resize → center crop → normalize
+        img = F.interpolate(
+            img[None], size=(self.resize_to, self.resize_to),
+            mode="bicubic", align_corners=False, antialias=True,
+        )[0]
+        off = (self.resize_to - self.crop_to) // 2
+        img = img[:, off:off + self.crop_to, off:off + self.crop_to].clamp(0.0, 1.0)
+        return (img - self.mean) / self.std
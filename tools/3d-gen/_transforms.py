@@ -0,0 +1,88 @@
+"""
+Batched rigid-transform construction for the mesh merge paths.
+
+build_transforms() returns the same (N, 4, 4) matrices as calling
+trimesh.transformations.compose_matrix(translate=pos, angles=radians(rot))
+once per part (static-frame XYZ Euler angles, i.e. M = T · Rz · Ry · Rx),
+but fills them in a single pass. The loop is JIT-compiled with Numba (listed
+in requirements.txt); an environment without it falls back to a vectorized
+NumPy version with the same output.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _fill_numpy(pos: np.ndarray, rot_deg: np.ndarray, out: np.ndarray) -> None:
+    ang = np.radians(rot_deg)
+    si, sj, sk = np.sin(ang).T
+    ci, cj, ck = np.cos(ang).T
+    cc, cs = ci * ck, ci * sk
+    sc, ss = si * ck, si * sk
+
+    out[:] = 0.0
+    out[:, 0, 0] = cj * ck
+    out[:, 0, 1] = sj * sc - cs
+    out[:, 0, 2] = sj * cc + ss
+    out[:, 1, 0] = cj * sk
+    out[:, 1, 1] = sj * ss + cc
+    out[:, 1, 2] = sj * cs - sc
+    out[:, 2, 0] = -sj
+    out[:, 2, 1] = cj * si
+    out[:, 2, 2] = cj * ci
+    out[:, :3, 3] = pos
+    out[:, 3, 3] = 1.0
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _fill_numba(pos, rot_deg, out):
+        for n in prange(pos.shape[0]):
+            ai = np.radians(rot_deg[n, 0])
+            aj = np.radians(rot_deg[n, 1])
+            ak = np.radians(rot_deg[n, 2])
+            si, sj, sk = np.sin(ai), np.sin(aj), np.sin(ak)
+            ci, cj, ck = np.cos(ai), np.cos(aj), np.cos(ak)
+            cc, cs = ci * ck, ci * sk
+            sc, ss = si * ck, si * sk
+
+            out[n, 0, 0] = cj * ck
+            out[n, 0, 1] = sj * sc - cs
+            out[n, 0, 2] = sj * cc + ss
+            out[n, 0, 3] = pos[n, 0]
+            out[n, 1, 0] = cj * sk
+            out[n, 1, 1] = sj * ss + cc
+            out[n, 1, 2] = sj * cs - sc
+            out[n, 1, 3] = pos[n, 1]
+            out[n, 2, 0] = -sj
+            out[n, 2, 1] = cj * si
+            out[n, 2, 2] = cj * ci
+            out[n, 2, 3] = pos[n, 2]
+            out[n, 3, 0] = 0.0
+            out[n, 3, 1] = 0.0
+            out[n, 3, 2] = 0.0
+            out[n, 3, 3] = 1.0
+
+
+def build_transforms(pos, rot_deg) -> np.ndarray:
+    """Build (N, 4, 4) transforms from (N, 3) positions and (N, 3) XYZ rotations in degrees."""
+    pos = np.ascontiguousarray(pos, dtype=np.float64).reshape(-1, 3)
+    rot_deg = np.ascontiguousarray(rot_deg, dtype=np.float64).reshape(-1, 3)
+    out = np.empty((pos.shape[0], 4, 4), dtype=np.float64)
+    if HAS_NUMBA:
+        _fill_numba(pos, rot_deg, out)
+    else:
+        _fill_numpy(pos, rot_deg, out)
+    return out
+
+
+def warmup() -> None:
+    """Trigger (or load the cached) JIT compilation before the first request."""
+    build_transforms(np.zeros((1, 3)), np.zeros((1, 3)))
@@ -8,6 +8,7 @@ Unified API for the 3D bot generation pipeline:
 - POST /merge          — Merge multiple GLBs via trimesh
 - POST /assemble       — LLM-driven slot-based assembly
 - POST /rig            — Auto-rig via UniRig pipeline
+- GET  /ready/{id}     — Whether a part's GLB has finished writing
 - GET  /status         — GPU/VRAM status
 - GET  /health         — Health check
 
@@ -17,24 +18,47 @@ Usage:
     uvicorn server:app --host 0.0.0.0 --port 8100 --reload
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
 import logging
 import os
-import subprocess
 import sys
+import threading
 import time
 import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 import trimesh
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from PIL import Image
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
+from PIL import Image, ImageOps
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    import torch
+
+import _transforms
+
+# ── CUDA allocator config (must be set before torch is first imported) ──
+# Expandable segments remap physical pages instead of hoarding fixed slabs, so
+# repeated load/unload cycles and varying octree resolutions don't fragment
+# the pool until it OOMs.
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:256"
+)
+
 # ── Windows CUDA DLL fix (must be before CUDA extension imports) ──
 _cuda_path = os.environ.get("CUDA_PATH", r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v12.0")
 _cuda_bin = os.path.join(_cuda_path, "bin")
@@ -58,6 +82,49 @@ UNIRIG_DIR = TOOLS_DIR / "UniRig"
 OUTPUT_DIR = PROJECT_ROOT / "public" / "parts" / "generated"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Background pool for host-side I/O (PNG/GLB writes) that shouldn't sit on
+# the critical path of GPU work
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pipeline-io")
+
+# One thread for every compiled DiT forward. reduce-overhead CUDA graph trees
+# are thread-local, so a forward landing on a fresh worker thread would
+# re-record its graphs into a second private memory pool.
+GPU_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gpu")
+
+
+async def _gpu_call(fn, *args, **kwargs):
+    """Run a blocking GPU call on GPU_EXECUTOR without stalling the event loop.
+
+    A running job can't be interrupted, so a cancelled caller still waits for
+    it to finish before the CancelledError propagates — callers holding
+    MODEL_LOCK never release it while their work is still on the GPU.
+    """
+    loop = asyncio.get_running_loop()
+    fut = loop.run_in_executor(GPU_EXECUTOR, functools.partial(fn, *args, **kwargs))
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        while not fut.done():
+            try:
+                await asyncio.wait([fut])
+            except asyncio.CancelledError:
+                pass
+        if not fut.cancelled():
+            fut.exception()  # retrieved, so an orphaned failure isn't logged as unhandled
+        raise
+
+
+# One more thread for the compiled on-device Preprocess. Calls run strictly one
+# at a time (the module and the pinned staging pool aren't safe to share), on
+# the side stream, so they can overlap a DiT forward on GPU_EXECUTOR.
+PREP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preprocess")
+
+
+async def _prep_call(fn, *args):
+    """Run a blocking preprocessing call on PREP_EXECUTOR."""
+    return await asyncio.get_running_loop().run_in_executor(PREP_EXECUTOR, fn, *args)
+
+
 # ── TripoSG paths ────────────────────────────────────────
 
 TRIPOSG_DIR = Path(__file__).resolve().parent / "TripoSG-model"
@@ -77,16 +144,293 @@ sys.path.insert(0, str(HUNYUAN3D_DIR))
 # Use "tencent/Hunyuan3D-2mini" for GPUs with < 12GB VRAM
 HUNYUAN3D_MODEL_ID = os.environ.get("HUNYUAN3D_MODEL", "tencent/Hunyuan3D-2")
 
+# ── Attention backend ────────────────────────────────────
+
+# Chosen once on first inference; both DiTs route attention through
+# F.scaled_dot_product_attention. PyTorch's default dispatch already picks the
+# flash / mem-efficient kernels whenever they're eligible, and MATH stays in
+# the list as the fallback, so this is not a speedup on its own. Its only
+# effect is to pin dispatch to a fixed kernel set (no cuDNN attention), so
+# every call site behaves the same across torch versions.
+_sdpa_backends = None
+
+
+def _get_sdpa_backends() -> list:
+    """Pick SDPA kernels once: flash → mem-efficient → math on Ampere+, no flash before."""
+    global _sdpa_backends
+    if _sdpa_backends is not None:
+        return _sdpa_backends
+
+    import torch
+    from torch.nn.attention import SDPBackend
+
+    backends = [SDPBackend.EFFICIENT_ATTENTION, SDPBackend.MATH]
+    if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 8:
+        backends.insert(0, SDPBackend.FLASH_ATTENTION)
+    _sdpa_backends = backends
+    log.info(f"SDPA backends: {[b.name for b in backends]}")
+    return _sdpa_backends
+
+
+def _attention_context():
+    """Context manager restricting SDPA to the backends picked above."""
+    try:
+        from torch.nn.attention import sdpa_kernel
+    except ImportError:
+        # torch < 2.3 — keep PyTorch's default dispatch
+        return contextlib.nullcontext()
+    return sdpa_kernel(_get_sdpa_backends())
+
+
+def _use_sdpa_processors(model, name: str) -> None:
+    """Swap diffusers' legacy AttnProcessor for AttnProcessor2_0 (fused SDPA).
+
+    Model-specific processors (TripoSG's, Hunyuan3D-Paint's multiview/ref
+    attention) are left alone — they carry extra logic and already call
+    scaled_dot_product_attention. No-op for non-diffusers models.
+    """
+    try:
+        from diffusers.models.attention_processor import AttnProcessor, AttnProcessor2_0
+    except ImportError:
+        return
+    procs = getattr(model, "attn_processors", None)
+    if not procs:
+        return
+    legacy = sum(type(p) is AttnProcessor for p in procs.values())
+    if legacy:
+        model.set_attn_processor({
+            key: AttnProcessor2_0() if type(p) is AttnProcessor else p
+            for key, p in procs.items()
+        })
+        log.info(f"{name}: {legacy}/{len(procs)} attention processors switched to SDPA")
+
+
+# ── Precision & compilation ──────────────────────────────
+
+
+def _inference_dtype(device: str):
+    """BF16 on GPUs that support it (Ampere+), FP16 on older cards, FP32 on CPU."""
+    import torch
+
+    if device != "cuda":
+        return torch.float32
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+
+def _autocast(device):
+    """Autocast to the inference dtype on CUDA so stray FP32 inputs hit BF16 kernels."""
+    import torch
+
+    if torch.device(device).type != "cuda":
+        return contextlib.nullcontext()
+    return torch.autocast("cuda", dtype=_inference_dtype("cuda"))
+
+
+def _compile_enabled() -> bool:
+    """torch.compile is used on CUDA unless TORCH_COMPILE_DISABLE=1."""
+    import torch
+
+    return os.environ.get("TORCH_COMPILE_DISABLE") != "1" and torch.cuda.is_available()
+
+
+def _compile_denoiser(module):
+    """Wrap a DiT with torch.compile (CUDA graphs + fused kernels).
+
+    Set TORCH_COMPILE_DISABLE=1 to run eager.
+    """
+    import torch
+
+    if not _compile_enabled():
+        return module
+    try:
+        return torch.compile(module, mode="reduce-overhead", fullgraph=False, dynamic=False)
+    except Exception as e:
+        log.warning(f"torch.compile unavailable, running eager: {e}")
+        return module
+
+
+def _warmup_image() -> Image.Image:
+    """Opaque grey square on a transparent canvas — enough for bg removal + crop."""
+    image = Image.new("RGBA", (512, 512), (255, 255, 255, 0))
+    image.paste((128, 128, 128, 255), (128, 128, 384, 384))
+    return image
+
+
+def _warmup(name: str, fn) -> None:
+    """Run one dummy forward so compile + CUDA graph capture happen before real traffic.
+
+    Always on the GPU thread — graphs recorded anywhere else would never be replayed.
+    """
+    if not _compile_enabled():
+        return
+    start = time.time()
+    try:
+        if threading.current_thread().name.startswith("gpu"):
+            fn()
+        else:
+            GPU_EXECUTOR.submit(fn).result()
+        log.info(f"{name} warmup done: {time.time() - start:.1f}s")
+    except Exception as e:
+        log.warning(f"{name} warmup failed (first request will compile): {e}")
+
+
+# ── VRAM residency planner ───────────────────────────────
+
+# Engines stay resident across requests. Another engine is only evicted when
+# the next one's weights + activation headroom won't fit in free VRAM, and
+# shape models are swapped to pinned host RAM rather than dropped.
+VRAM_RESERVE_BYTES = int(float(os.environ.get("VRAM_RESERVE_GB", "4")) * 1e9)
+
+# Slab reserved after each load so the first inference doesn't grow the pool
+CUDA_WARM_POOL_BYTES = int(os.environ.get("CUDA_WARM_POOL_MB", "1024")) << 20
+
+# First-load estimates, replaced by the measured footprint once loaded
+_weight_bytes: dict[str, int] = {
+    "triposg": int(5e9),
+    "hunyuan3d": int(6e9),
+    "hunyuan3d_text2img": int(8e9),
+    "hunyuan3d_paint": int(10e9),
+    "unirig": int(8e9),  # separate process — never measured
+}
+_on_gpu: dict[str, bool] = {}  # engine → weights currently in VRAM
+
+# Cheapest to bring back first: paint/text2img are dropped, shape models swapped
+_EVICTION_ORDER = ["hunyuan3d_paint", "hunyuan3d_text2img", "triposg", "hunyuan3d"]
+
+# Loading, evicting and running a forward hold MODEL_LOCK and go through
+# _gpu_call, which doesn't return until the GPU job is done (even when the
+# caller is cancelled), so residency can't change under a forward that's
+# still running. asyncio.Lock wakes waiters in arrival order: a request
+# needing another engine queues behind the current one instead of
+# interleaving evictions. Concurrent TripoSG requests still share one
+# forward — the batcher takes the lock once per batch.
+MODEL_LOCK = asyncio.Lock()
+
+# Work that needs an engine resident but shouldn't serialize against forwards
+# (TripoSG preprocessing) pins it instead of holding the lock; make_room_for
+# waits for an engine's pins to drop before evicting it. New pins are only
+# taken under MODEL_LOCK, so an eviction waiting here can't be starved.
+_pins: dict[str, int] = {}
+_pins_cond = threading.Condition()
+
+
+@asynccontextmanager
+async def _resident(name: str, loader):
+    """Load/restore an engine under MODEL_LOCK, then keep it pinned (not locked) while in use."""
+    async with MODEL_LOCK:
+        models = await _gpu_call(loader)
+        with _pins_cond:
+            _pins[name] = _pins.get(name, 0) + 1
+    try:
+        yield models
+    finally:
+        with _pins_cond:
+            _pins[name] -= 1
+            _pins_cond.notify_all()
+
+
+def _vram_allocated() -> int:
+    import torch
+
+    return torch.cuda.memory_allocated() if torch.cuda.is_available() else 0
+
+
+def _warm_allocator() -> None:
+    """Release cached blocks, then reserve one large slab for activations."""
+    import torch
+
+    if not torch.cuda.is_available() or CUDA_WARM_POOL_BYTES <= 0:
+        return
+    torch.cuda.empty_cache()
+    slab = torch.empty(CUDA_WARM_POOL_BYTES, dtype=torch.uint8, device="cuda")
+    del slab
+
+
+def _free_vram() -> int:
+    """Free VRAM from the driver plus what the caching allocator holds but isn't using."""
+    import torch
+
+    free, _ = torch.cuda.mem_get_info()
+    return free + torch.cuda.memory_reserved() - torch.cuda.memory_allocated()
+
+
+def _track_load(name: str, allocated_before: int) -> None:
+    """Record an engine's measured weight footprint right after it loads."""
+    footprint = _vram_allocated() - allocated_before
+    if footprint > 0:
+        _weight_bytes[name] = footprint
+    _on_gpu[name] = True
+    _warm_allocator()
+
+
+def _pin_to_host(modules: list) -> None:
+    """Move modules to host RAM with pinned storage so the reload is a fast DMA."""
+    for module in modules:
+        module.to("cpu")
+        for t in itertools.chain(module.parameters(), module.buffers()):
+            t.data = t.data.pin_memory()
+
+
+def _restore_to_gpu(modules: list) -> None:
+    """Copy pinned host modules back to VRAM."""
+    import torch
+
+    for module in modules:
+        module.to("cuda", non_blocking=True)
+    torch.cuda.synchronize()
+
+
+def _evict(name: str) -> None:
+    if name == "triposg":
+        offload_triposg()
+    elif name == "hunyuan3d":
+        offload_hunyuan3d()
+    elif name == "hunyuan3d_text2img":
+        unload_hunyuan3d_text2img()
+    elif name == "hunyuan3d_paint":
+        unload_hunyuan3d_paint()
+
+
+def make_room_for(name: str, keep: tuple[str, ...] = ()) -> None:
+    """Evict other engines, cheapest first, only while `name` wouldn't fit in free VRAM."""
+    import torch
+
+    if not torch.cuda.is_available() or _on_gpu.get(name):
+        return
+
+    needed = _weight_bytes.get(name, 0) + VRAM_RESERVE_BYTES
+    for other in _EVICTION_ORDER:
+        free = _free_vram()
+        if needed <= free:
+            return
+        if other == name or other in keep or not _on_gpu.get(other):
+            continue
+        log.info(
+            f"VRAM: {free / 1e9:.1f}GB free < {needed / 1e9:.1f}GB for {name}, "
+            f"evicting {other}"
+        )
+        with _pins_cond:
+            _pins_cond.wait_for(lambda: not _pins.get(other))
+        _evict(other)
+
+
 # ── TripoSG lazy loading ────────────────────────────────
 
 triposg_pipe = None
 rmbg_net = None
+triposg_stream = None  # side stream for host→device image uploads
+triposg_preprocess = None  # on-device _prepare_image + DINOv2 processor (CUDA only)
 
 
 def get_triposg_models():
     """Lazy-load TripoSG pipeline + RMBG on first use."""
-    global triposg_pipe, rmbg_net
+    global triposg_pipe, rmbg_net, triposg_stream, triposg_preprocess
     if triposg_pipe is not None:
+        if _on_gpu.get("triposg") is False:
+            make_room_for("triposg")
+            _restore_to_gpu(_triposg_modules())
+            _on_gpu["triposg"] = True
+            log.info("TripoSG restored to VRAM")
         return triposg_pipe, rmbg_net
 
     try:
@@ -96,7 +440,9 @@ def get_triposg_models():
         from briarmbg import BriaRMBG
 
         device = "cuda" if torch.cuda.is_available() else "cpu"
-        dtype = torch.float16 if device == "cuda" else torch.float32
+        dtype = _inference_dtype(device)
+        make_room_for("triposg")
+        allocated_before = _vram_allocated()
 
         # Download model weights if not cached
         log.info("Loading TripoSG model (first time downloads ~3GB)...")
@@ -112,7 +458,34 @@ def get_triposg_models():
         triposg_pipe = TripoSGPipeline.from_pretrained(
             str(TRIPOSG_WEIGHTS)
         ).to(device, dtype)
-        log.info(f"TripoSG loaded on {device}")
+        _use_sdpa_processors(triposg_pipe.transformer, "TripoSG")
+        triposg_pipe.transformer = _compile_denoiser(triposg_pipe.transformer)
+        log.info(f"TripoSG loaded on {device} ({dtype})")
+        if device == "cuda":
+            from _preprocess import Preprocess
+
+            triposg_stream = torch.cuda.Stream()
+            triposg_preprocess = Preprocess(
+                triposg_pipe.feature_extractor_dinov2, side=PREPARED_SIDE
+            ).to(device)
+            if _compile_enabled():
+                # Output shape is fixed; only the upload's H×W varies
+                triposg_preprocess.forward = torch.compile(
+                    triposg_preprocess.forward, dynamic=True
+                )
+            _track_load("triposg", allocated_before)
+        _prefill_generators(triposg_pipe.device, _batch_bucket(TRIPOSG_MAX_BATCH))
+
+        def _warm():
+            PREP_EXECUTOR.submit(_preprocess_image, _warmup_image(), rmbg_net).result()
+            with torch.no_grad(), _autocast(device), _attention_context():
+                triposg_pipe(
+                    image=_warmup_image().convert("RGB"),
+                    num_inference_steps=2,
+                    guidance_scale=7.0,
+                )
+
+        _warmup("TripoSG", _warm)
 
         return triposg_pipe, rmbg_net
     except ImportError as e:
@@ -125,7 +498,7 @@ def get_triposg_models():
 
 def unload_triposg():
     """Free TripoSG from VRAM when needed by other models."""
-    global triposg_pipe, rmbg_net
+    global triposg_pipe, rmbg_net, triposg_stream, triposg_preprocess
     if triposg_pipe is not None or rmbg_net is not None:
         import gc
         import torch
@@ -133,11 +506,356 @@ def unload_triposg():
         del triposg_pipe, rmbg_net
         triposg_pipe = None
         rmbg_net = None
+        triposg_stream = None
+        triposg_preprocess = None
+        _on_gpu.pop("triposg", None)
         gc.collect()
         torch.cuda.empty_cache()
         log.info("TripoSG unloaded, VRAM freed")
 
 
+def _triposg_modules() -> list:
+    import torch
+
+    modules = [m for m in triposg_pipe.components.values() if isinstance(m, torch.nn.Module)]
+    return modules + [rmbg_net]
+
+
+def offload_triposg():
+    """Swap TripoSG + RMBG to pinned host RAM; get_triposg_models() moves them back."""
+    if triposg_pipe is None or not _on_gpu.get("triposg"):
+        return
+    import gc
+    import torch
+
+    _pin_to_host(_triposg_modules())
+    _on_gpu["triposg"] = False
+    gc.collect()
+    torch.cuda.empty_cache()
+    log.info("TripoSG offloaded to host RAM")
+
+
+# ── TripoSG preprocessing ────────────────────────────────
+
+
+# Longest side kept when decoding uploads/downloads — matches the RMBG input
+# resolution; the foreground crop in _prepare_image happens after this.
+DECODE_MAX_SIDE = 1024
+
+# Every preprocessed image leaves _prepare_image at this fixed square size, so
+# the image encoder ahead of the compiled DiT always sees one input shape.
+PREPARED_SIDE = 512
+
+
+def _decode_image(data: bytes, max_side: int = DECODE_MAX_SIDE) -> Image.Image:
+    """Decode image bytes at reduced scale, without materializing full-res RGBA.
+
+    For JPEGs, draft() makes libjpeg decode at 1/2, 1/4 or 1/8 scale in the
+    DCT domain (no-op for other formats); thumbnail() finishes the resize.
+    """
+    image = Image.open(BytesIO(data))
+    image.draft("RGB", (max_side, max_side))
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((max_side, max_side), Image.LANCZOS)
+    return image
+
+
+def _rmbg_mask(rgb: np.ndarray, net) -> np.ndarray:
+    """Predict a uint8 foreground matte with RMBG-1.4 (1024² input, mean 0.5, std 1.0)."""
+    import torch
+    import torch.nn.functional as F
+
+    device = next(net.parameters()).device
+    x = torch.from_numpy(rgb).to(device).permute(2, 0, 1).unsqueeze(0).float() / 255.0
+    x = F.interpolate(x, size=(1024, 1024), mode="bilinear") - 0.5
+    with torch.no_grad():
+        pred = net(x)[0][0]
+    pred = F.interpolate(pred, size=rgb.shape[:2], mode="bilinear")[0, 0]
+    pred = (pred - pred.min()) / (pred.max() - pred.min() + 1e-8)
+    return (pred * 255).byte().cpu().numpy()
+
+
+def _prepare_image(
+    image: Image.Image,
+    rmbg_net,
+    bg_color: np.ndarray = np.array([1.0, 1.0, 1.0]),
+    padding_ratio: float = 0.1,
+) -> Image.Image:
+    """In-memory equivalent of TripoSG's prepare_image (which only takes a file path).
+
+    Alpha matte (from the image, else RMBG) → crop to foreground → pad to
+    square → composite onto bg_color → resize to PREPARED_SIDE.
+    """
+    rgba = np.asarray(image.convert("RGBA"))
+    rgb, alpha = rgba[..., :3], rgba[..., 3]
+
+    # Only trust an existing alpha channel if it actually separates something
+    if (alpha < 128).mean() < 0.01 or (alpha >= 128).mean() < 0.01:
+        alpha = _rmbg_mask(np.ascontiguousarray(rgb), rmbg_net)
+
+    ys, xs = np.nonzero(alpha > 127)
+    if len(ys):
+        rgb = rgb[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+        alpha = alpha[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+
+    h, w = alpha.shape
+    side = int(max(h, w) * (1 + 2 * padding_ratio))
+    top, left = (side - h) // 2, (side - w) // 2
+    a = np.zeros((side, side, 1), dtype=np.float32)
+    a[top:top + h, left:left + w, 0] = alpha / 255.0
+    fg = np.zeros((side, side, 3), dtype=np.float32)
+    fg[top:top + h, left:left + w] = rgb / 255.0
+
+    out = fg * a + bg_color.astype(np.float32) * (1.0 - a)
+    out = Image.fromarray((out * 255).round().astype(np.uint8))
+    if side != PREPARED_SIDE:
+        out = out.resize((PREPARED_SIDE, PREPARED_SIDE), Image.LANCZOS)
+    return out
+
+
+# Reusable pinned staging buffers for raw RGBA uploads, sized for the largest
+# decoded image. Each carries the CUDA event of its last copy so it is only
+# overwritten once that copy has landed; concurrent preprocess threads each
+# pop their own. Like _generator_pool, deque popleft/append need no lock.
+STAGING_BYTES = DECODE_MAX_SIDE * DECODE_MAX_SIDE * 4
+_staging_pool: deque = deque()
+
+
+def _stage_rgba(rgba: np.ndarray):
+    """Copy (H, W, 4) uint8 to the GPU through a pinned buffer on the current stream."""
+    import torch
+
+    if rgba.nbytes > STAGING_BYTES:
+        # Oversized input that skipped _decode_image: plain pageable copy
+        return torch.from_numpy(np.ascontiguousarray(rgba)).to("cuda", non_blocking=True)
+
+    try:
+        buf, copied = _staging_pool.popleft()
+        copied.synchronize()
+    except IndexError:
+        buf = torch.empty(STAGING_BYTES, dtype=torch.uint8, pin_memory=True)
+        copied = torch.cuda.Event()
+
+    host = buf[:rgba.nbytes].view(rgba.shape)
+    host.numpy()[...] = rgba
+    gpu = host.to("cuda", non_blocking=True)
+    copied.record()
+    _staging_pool.append((buf, copied))
+    return gpu
+
+
+def _preprocess_image(image: Image.Image, rmbg_net) -> "torch.Tensor | Image.Image":
+    """TripoSG input for one decoded image. Blocking — call via _prep_call.
+
+    On CUDA this is a (3, C, C) pixel tensor built on the side stream by
+    _preprocess.Preprocess (fixed PREPARED_SIDE canvas, then the DINOv2
+    resize/normalize), so only the raw uint8 upload crosses the bus. On CPU
+    it falls back to the NumPy/PIL _prepare_image.
+    """
+    if triposg_preprocess is None:
+        return _prepare_image(image, rmbg_net)
+
+    import torch
+
+    rgba = np.asarray(image.convert("RGBA"))
+    with torch.no_grad(), torch.cuda.stream(triposg_stream):
+        gpu_rgba = _stage_rgba(rgba)
+        return triposg_preprocess(gpu_rgba, triposg_preprocess.matte(gpu_rgba, rmbg_net))
+
+
+def _upload_image(pipe, images: "list[torch.Tensor | Image.Image]"):
+    """Hand a batch of _preprocess_image outputs to the pipeline.
+
+    On CUDA these are (3, C, C) pixel tensors already on the device, written on
+    the side stream; they only need stacking once that stream is done (the
+    pipeline skips its own feature extraction for tensor input). On CPU they
+    are PIL images and pass through unchanged.
+    """
+    import torch
+
+    if triposg_stream is None:
+        return images
+
+    torch.cuda.current_stream().wait_stream(triposg_stream)
+    for t in images:
+        t.record_stream(torch.cuda.current_stream())
+    return torch.stack(images).to(pipe.dtype)
+
+
+# ── TripoSG micro-batcher ────────────────────────────────
+
+# Concurrent /generate requests are stacked along the batch dim so the DiT
+# runs one forward per step for all of them instead of one per client.
+# Lower TRIPOSG_MAX_BATCH on GPUs where DiT step time grows faster than batch.
+TRIPOSG_MAX_BATCH = int(os.environ.get("TRIPOSG_MAX_BATCH", "8"))
+TRIPOSG_MAX_WAIT_MS = int(os.environ.get("TRIPOSG_MAX_WAIT_MS", "50"))
+
+_triposg_queue: asyncio.Queue | None = None
+_triposg_worker: asyncio.Task | None = None
+
+# Pre-initialized generators per device — reseeding is cheap, creating a CUDA
+# generator is not. deque popleft/extend are atomic, so no lock is needed;
+# the pool grows to the largest batch ever in flight.
+_generator_pool: dict[str, deque] = {}
+
+
+def _acquire_generators(device, seeds: list[int]) -> list:
+    """Take one generator per seed from the device's pool, reseeded."""
+    import torch
+
+    pool = _generator_pool.setdefault(str(device), deque())
+    generators = []
+    for seed in seeds:
+        try:
+            gen = pool.popleft()
+        except IndexError:
+            gen = torch.Generator(device=device)
+        generators.append(gen.manual_seed(seed))
+    return generators
+
+
+def _release_generators(device, generators: list) -> None:
+    _generator_pool.setdefault(str(device), deque()).extend(generators)
+
+
+def _prefill_generators(device, n: int) -> None:
+    """Create `n` pooled generators up front so no request pays for init."""
+    import torch
+
+    _release_generators(device, [torch.Generator(device=device) for _ in range(n)])
+
+
+def _batch_bucket(n: int) -> int:
+    """Round a batch size up to the next power of two, capped at TRIPOSG_MAX_BATCH.
+
+    The compiled DiT captures one CUDA graph per input shape; bucketing keeps
+    that to about log2(TRIPOSG_MAX_BATCH) graphs instead of one per batch size.
+    The cap means a non-power-of-two limit (e.g. 6) is never exceeded.
+    """
+    return max(n, min(1 << (n - 1).bit_length(), TRIPOSG_MAX_BATCH))
+
+
+def _run_triposg_batch(
+    images: "list[torch.Tensor | Image.Image]",
+    seeds: list[int],
+    num_inference_steps: int,
+    guidance_scale: float,
+) -> list:
+    """Blocking TripoSG forward over a batch of preprocessed images → [(verts, faces), ...]."""
+    import torch
+
+    pipe, _ = get_triposg_models()
+    if pipe is None:
+        raise HTTPException(503, "TripoSG model not available")
+
+    n = len(images)
+    if _compile_enabled():
+        # Pad with repeats of the last slot; the padded samples are discarded.
+        # Padding goes through the whole pipe() call, so each pad slot also pays
+        # for VAE decode + surface extraction — accepted in exchange for never
+        # re-capturing the DiT's CUDA graphs on a new batch size.
+        pad = _batch_bucket(n) - n
+        images = images + images[-1:] * pad
+        seeds = seeds + seeds[-1:] * pad
+
+    generators = _acquire_generators(pipe.device, seeds)
+    try:
+        with torch.no_grad(), _autocast(pipe.device), _attention_context():
+            return pipe(
+                image=_upload_image(pipe, images),
+                generator=generators,
+                num_inference_steps=num_inference_steps,
+                guidance_scale=guidance_scale,
+            ).samples[:n]
+    finally:
+        _release_generators(pipe.device, generators)
+
+
+async def _gather_batch(queue: asyncio.Queue, max_batch: int, max_wait_ms: int) -> list:
+    """Block for one item, then collect more until max_batch or max_wait_ms elapses."""
+    loop = asyncio.get_running_loop()
+    batch = [await queue.get()]
+    deadline = loop.time() + max_wait_ms / 1000
+    while len(batch) < max_batch:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _triposg_batch_loop():
+    """Background worker: drain the queue and run one pipe() per (steps, guidance) group."""
+    while True:
+        batch = await _gather_batch(_triposg_queue, TRIPOSG_MAX_BATCH, TRIPOSG_MAX_WAIT_MS)
+
+        groups: dict[tuple[int, float], list] = {}
+        for item in batch:
+            groups.setdefault((item[2], item[3]), []).append(item)
+
+        for (steps, guidance), items in groups.items():
+            # Callers that were cancelled while queued don't need a forward
+            items = [item for item in items if not item[-1].done()]
+            if not items:
+                continue
+            log.info(f"TripoSG batch: {len(items)} image(s), {steps} steps")
+            try:
+                async with MODEL_LOCK:
+                    samples = await _gpu_call(
+                        _run_triposg_batch,
+                        [img for img, *_ in items],
+                        [seed for _, seed, *_ in items],
+                        steps,
+                        guidance,
+                    )
+            except Exception as e:
+                for *_, fut in items:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            for (*_, fut), sample in zip(items, samples):
+                if not fut.done():
+                    fut.set_result(sample)
+
+
+async def _triposg_infer_many(
+    images: "list[torch.Tensor | Image.Image]",
+    seed: int,
+    num_inference_steps: int,
+    guidance_scale: float,
+) -> list:
+    """Queue preprocessed images for the batcher together and await their (verts, faces).
+
+    Everything is enqueued before the worker can wake, so the images share one
+    batch (up to TRIPOSG_MAX_BATCH) regardless of TRIPOSG_MAX_WAIT_MS.
+    """
+    global _triposg_queue, _triposg_worker
+    if _triposg_worker is None or _triposg_worker.done():
+        _triposg_queue = asyncio.Queue()
+        _triposg_worker = asyncio.create_task(_triposg_batch_loop())
+
+    loop = asyncio.get_running_loop()
+    futs = []
+    for img_pil in images:
+        fut = loop.create_future()
+        _triposg_queue.put_nowait((img_pil, seed, num_inference_steps, guidance_scale, fut))
+        futs.append(fut)
+    return list(await asyncio.gather(*futs))
+
+
+async def _triposg_infer(
+    img_pil: "torch.Tensor | Image.Image",
+    seed: int,
+    num_inference_steps: int,
+    guidance_scale: float,
+):
+    """Queue one preprocessed image for the batcher and await its (verts, faces)."""
+    return (await _triposg_infer_many([img_pil], seed, num_inference_steps, guidance_scale))[0]
+
+
 # ── Hunyuan3D lazy loading ───────────────────────────────
 
 hunyuan3d_pipe = None
@@ -148,16 +866,43 @@ def get_hunyuan3d_model():
     """Lazy-load Hunyuan3D shape generation pipeline on first use."""
     global hunyuan3d_pipe
     if hunyuan3d_pipe is not None:
+        if _on_gpu.get("hunyuan3d") is False:
+            make_room_for("hunyuan3d")
+            _restore_to_gpu(_hunyuan3d_modules())
+            _on_gpu["hunyuan3d"] = True
+            log.info("Hunyuan3D shape model restored to VRAM")
         return hunyuan3d_pipe
 
     try:
+        import torch
         from hy3dgen.shapegen import Hunyuan3DDiTFlowMatchingPipeline
 
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        dtype = _inference_dtype(device)
+        make_room_for("hunyuan3d")
+        allocated_before = _vram_allocated()
+
         log.info(f"Loading Hunyuan3D shape model: {HUNYUAN3D_MODEL_ID}...")
         hunyuan3d_pipe = Hunyuan3DDiTFlowMatchingPipeline.from_pretrained(
             HUNYUAN3D_MODEL_ID,
+            device=device,
+            dtype=dtype,
         )
-        log.info(f"Hunyuan3D shape model loaded: {HUNYUAN3D_MODEL_ID}")
+        hunyuan3d_pipe.model = _compile_denoiser(hunyuan3d_pipe.model)
+        log.info(f"Hunyuan3D shape model loaded: {HUNYUAN3D_MODEL_ID} ({dtype})")
+        if device == "cuda":
+            _track_load("hunyuan3d", allocated_before)
+
+        def _warm():
+            with _attention_context():
+                hunyuan3d_pipe(
+                    image=_warmup_image(),
+                    num_inference_steps=2,
+                    generator=torch.manual_seed(0),
+                    output_type="latent",
+                )
+
+        _warmup("Hunyuan3D", _warm)
         return hunyuan3d_pipe
     except ImportError as e:
         log.warning(f"Hunyuan3D not installed — shape gen unavailable: {e}")
@@ -178,8 +923,13 @@ def get_hunyuan3d_text2img():
     try:
         from hy3dgen.text2image import HunyuanDiTPipeline
 
+        # The shape model is about to consume this image — never evict it here
+        make_room_for("hunyuan3d_text2img", keep=("hunyuan3d",))
+        allocated_before = _vram_allocated()
+
         log.info("Loading HunyuanDiT text-to-image model...")
         hunyuan3d_text2img = HunyuanDiTPipeline()
+        _track_load("hunyuan3d_text2img", allocated_before)
         log.info("HunyuanDiT text-to-image model loaded")
         return hunyuan3d_text2img
     except ImportError as e:
@@ -202,11 +952,13 @@ def unload_hunyuan3d():
     if hunyuan3d_pipe is not None:
         del hunyuan3d_pipe
         hunyuan3d_pipe = None
+        _on_gpu.pop("hunyuan3d", None)
         freed = True
         log.info("Hunyuan3D shape model unloaded")
     if hunyuan3d_text2img is not None:
         del hunyuan3d_text2img
         hunyuan3d_text2img = None
+        _on_gpu.pop("hunyuan3d_text2img", None)
         freed = True
         log.info("HunyuanDiT text2img unloaded")
     if freed:
@@ -215,6 +967,40 @@ def unload_hunyuan3d():
         log.info("VRAM freed")
 
 
+def unload_hunyuan3d_text2img():
+    """Free only HunyuanDiT text-to-image, keeping the shape model."""
+    global hunyuan3d_text2img
+    if hunyuan3d_text2img is None:
+        return
+    import gc
+    import torch
+
+    del hunyuan3d_text2img
+    hunyuan3d_text2img = None
+    _on_gpu.pop("hunyuan3d_text2img", None)
+    gc.collect()
+    torch.cuda.empty_cache()
+    log.info("HunyuanDiT text2img unloaded, VRAM freed")
+
+
+def _hunyuan3d_modules() -> list:
+    return [hunyuan3d_pipe.model, hunyuan3d_pipe.vae, hunyuan3d_pipe.conditioner]
+
+
+def offload_hunyuan3d():
+    """Swap the Hunyuan3D shape model to pinned host RAM; the getter moves it back."""
+    if hunyuan3d_pipe is None or not _on_gpu.get("hunyuan3d"):
+        return
+    import gc
+    import torch
+
+    _pin_to_host(_hunyuan3d_modules())
+    _on_gpu["hunyuan3d"] = False
+    gc.collect()
+    torch.cuda.empty_cache()
+    log.info("Hunyuan3D shape model offloaded to host RAM")
+
+
 # ── Hunyuan3D-Paint lazy loading ─────────────────────────
 
 hunyuan3d_paint = None
@@ -227,12 +1013,27 @@ def get_hunyuan3d_paint():
         return hunyuan3d_paint
 
     try:
+        import gc
+        import torch
         from hy3dgen.texgen import Hunyuan3DPaintPipeline
 
+        make_room_for("hunyuan3d_paint")
+        # Stage boundary: release dead tensors from earlier stages once, here,
+        # so the paint weights land in a compacted cache (never per step)
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        allocated_before = _vram_allocated()
+
         log.info(f"Loading Hunyuan3D-Paint texture pipeline: {HUNYUAN3D_MODEL_ID}...")
         hunyuan3d_paint = Hunyuan3DPaintPipeline.from_pretrained(
             HUNYUAN3D_MODEL_ID,
         )
+        multiview = hunyuan3d_paint.models.get("multiview_model")
+        unet = getattr(getattr(multiview, "pipeline", None), "unet", None)
+        if unet is not None:
+            _use_sdpa_processors(unet, "Hunyuan3D-Paint")
+        _track_load("hunyuan3d_paint", allocated_before)
         log.info("Hunyuan3D-Paint loaded")
         return hunyuan3d_paint
     except ImportError as e:
@@ -254,6 +1055,7 @@ def unload_hunyuan3d_paint():
     if hunyuan3d_paint is not None:
         del hunyuan3d_paint
         hunyuan3d_paint = None
+        _on_gpu.pop("hunyuan3d_paint", None)
         gc.collect()
         torch.cuda.empty_cache()
         log.info("Hunyuan3D-Paint unloaded, VRAM freed")
@@ -266,7 +1068,29 @@ def unload_hunyuan3d_paint():
 async def lifespan(app: FastAPI):
     log.info("3D Pipeline Server starting...")
     log.info(f"Output directory: {OUTPUT_DIR}")
+    _transforms.warmup()
+
+    # Shared search clients — keeps the keepalive pool + DDG cookies across calls
+    try:
+        import httpx
+        from duckduckgo_search import DDGS
+
+        app.state.http = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        app.state.ddgs = DDGS()
+    except ImportError as e:
+        log.warning(f"duckduckgo_search/httpx not installed — /search-image unavailable: {e}")
+        app.state.http = None
+        app.state.ddgs = None
+
     yield
+    if app.state.http is not None:
+        await app.state.http.aclose()
+    if _triposg_worker is not None:
+        _triposg_worker.cancel()
+    await _stop_unirig_worker()
     unload_triposg()
     unload_hunyuan3d()
     log.info("3D Pipeline Server stopped")
@@ -286,6 +1110,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GLB JSON chunks + index buffers and API JSON compress well; PNG/JPEG refs are
+# in the middleware's excluded types. Level 5: large GLBs stay cheap to encode.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ── Models ───────────────────────────────────────────────
 
@@ -413,6 +1241,7 @@ async def status():
         "gpu": gpu_info,
         "triposg_loaded": triposg_pipe is not None,
         "hunyuan3d_loaded": hunyuan3d_pipe is not None,
+        "vram_resident": dict(_on_gpu),
         "hunyuan3d_model": HUNYUAN3D_MODEL_ID,
         "engines_available": ["triposg"]
             + (["hunyuan3d"] if True else []),
@@ -421,11 +1250,99 @@ async def status():
     }
 
 
+# ── Content-addressed result cache ───────────────────────
+
+# Generations are deterministic for a given input + seed + settings, so each
+# result dict is stored as cache_<key>.json next to the GLB it points at.
+
+
+def _cache_key(**kwargs) -> str:
+    """Stable hash of the generation inputs (bytes should be pre-hashed)."""
+    return hashlib.sha256(json.dumps(kwargs, sort_keys=True).encode()).hexdigest()[:32]
+
+
+def _cache_get(key: str) -> dict | None:
+    """Return the cached result dict if it and every file it references still exist."""
+    try:
+        result = json.loads((OUTPUT_DIR / f"cache_{key}.json").read_text())
+    except (OSError, ValueError):
+        return None
+    for field in ("glb_path", "ref_image_path"):
+        if field in result and not (PROJECT_ROOT / "public" / result[field].lstrip("/")).exists():
+            return None
+    log.info(f"Cache hit {key}: {result['glb_path']}")
+    return {**result, "cached": True}
+
+
+def _cache_put(key: str, result: dict) -> None:
+    (OUTPUT_DIR / f"cache_{key}.json").write_text(json.dumps(result))
+
+
+# ── Deferred GLB export ──────────────────────────────────
+
+# filename → set once the background export has written it
+_pending_exports: dict[str, asyncio.Event] = {}
+
+# How long a GLB download waits on an in-flight export before 425 Too Early
+EXPORT_WAIT_S = 60
+
+
+async def _export_in_background(mesh, output_path: Path, cache_key: str, result: dict):
+    """Write a GLB after the response has gone out, then publish it to the cache."""
+    try:
+        file_size = await asyncio.to_thread(_export_glb, mesh, output_path)
+        log.info(f"Saved GLB: {output_path} ({file_size} bytes)")
+        _cache_put(cache_key, result)
+    except Exception as e:
+        log.error(f"Background export failed for {output_path.name}: {e}")
+    finally:
+        _pending_exports.pop(output_path.name).set()
+
+
+async def _wait_for_export(filename: str) -> bool:
+    """Wait out an in-flight background export of `filename`; False if it timed out."""
+    pending = _pending_exports.get(filename)
+    if pending is None:
+        return True
+    try:
+        await asyncio.wait_for(pending.wait(), EXPORT_WAIT_S)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def resolve_glb(web_path: str, what: str = "GLB") -> Path:
+    """Map a web path (/parts/generated/X.glb) to its file on disk.
+
+    Waits for /generate's background export first, so callers chaining
+    straight off a /generate response never see a missing or half-written
+    file. Tries public/ first, then the project root.
+    """
+    if not await _wait_for_export(os.path.basename(web_path)):
+        raise HTTPException(425, f"{what} is still being written: {web_path}")
+    raw_path = web_path.lstrip("/")
+    for path in (PROJECT_ROOT / "public" / raw_path, PROJECT_ROOT / raw_path):
+        if path.exists():
+            return path
+    raise HTTPException(404, f"{what} not found: {web_path}")
+
+
+@app.get("/ready/{part_id}")
+async def part_ready(part_id: str):
+    """Whether a part's GLB has finished writing."""
+    filename = f"{part_id}.glb"
+    return {
+        "part_id": part_id,
+        "ready": filename not in _pending_exports and (OUTPUT_DIR / filename).exists(),
+    }
+
+
 # ── POST /generate — Image → 3D Mesh ────────────────────
 
 
 @app.post("/generate")
 async def generate_3d(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     num_inference_steps: int = 50,
     guidance_scale: float = 7.0,
@@ -433,93 +1350,59 @@ async def generate_3d(
     faces: int = -1,
 ):
     """Generate a 3D .glb mesh from an uploaded image using TripoSG."""
-    pipe, rmbg = get_triposg_models()
-    if pipe is None:
-        raise HTTPException(
-            503,
-            "TripoSG model not available. Install dependencies first.",
-        )
+    image_data = await file.read()
+    cache_key = _cache_key(
+        engine="triposg",
+        image=hashlib.sha256(image_data).hexdigest(),
+        seed=seed,
+        steps=num_inference_steps,
+        guidance=guidance_scale,
+        faces=faces,
+    )
+    if (cached := _cache_get(cache_key)) is not None:
+        return cached
 
     try:
-        import torch
-        from image_process import prepare_image
-        import tempfile
-
-        # Read image and save to temp file (prepare_image needs file path)
-        image_data = await file.read()
-        image = Image.open(BytesIO(image_data))
+        image = await asyncio.to_thread(_decode_image, image_data)
         log.info(
             f"Generating 3D from image: {file.filename} ({image.size[0]}x{image.size[1]})"
         )
 
-        # Save to temp file for prepare_image
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            image.save(tmp, format="PNG")
-            tmp_path = tmp.name
-
-        try:
-            # TripoSG preprocessing: bg removal + crop + pad
-            img_pil = prepare_image(
-                tmp_path,
-                bg_color=np.array([1.0, 1.0, 1.0]),
-                rmbg_net=rmbg,
-            )
-            log.info("Image preprocessed (bg removed, cropped, padded)")
-        finally:
-            os.unlink(tmp_path)
+        # TripoSG preprocessing: bg removal + crop + pad (RMBG must stay resident)
+        async with _resident("triposg", get_triposg_models) as (pipe, rmbg):
+            if pipe is None:
+                raise HTTPException(
+                    503,
+                    "TripoSG model not available. Install dependencies first.",
+                )
+            img_pil = await _prep_call(_preprocess_image, image, rmbg)
+        log.info("Image preprocessed (bg removed, cropped, padded)")
 
-        # Run TripoSG inference
+        # Run TripoSG inference (batched with any concurrent requests)
         start = time.time()
-        with torch.no_grad():
-            outputs = pipe(
-                image=img_pil,
-                generator=torch.Generator(device=pipe.device).manual_seed(seed),
-                num_inference_steps=num_inference_steps,
-                guidance_scale=guidance_scale,
-            ).samples[0]
-
-        mesh = trimesh.Trimesh(
-            outputs[0].astype(np.float32),
-            np.ascontiguousarray(outputs[1]),
-        )
-
-        # Optional face reduction
-        if faces > 0 and mesh.faces.shape[0] > faces:
-            try:
-                import pymeshlab
-                ms = pymeshlab.MeshSet()
-                ms.add_mesh(pymeshlab.Mesh(
-                    vertex_matrix=mesh.vertices,
-                    face_matrix=mesh.faces,
-                ))
-                ms.meshing_merge_close_vertices()
-                ms.meshing_decimation_quadric_edge_collapse(targetfacenum=faces)
-                cm = ms.current_mesh()
-                mesh = trimesh.Trimesh(
-                    vertices=cm.vertex_matrix(),
-                    faces=cm.face_matrix(),
-                )
-                log.info(f"Mesh simplified to {faces} faces")
-            except Exception as e:
-                log.warning(f"Face reduction failed, using full mesh: {e}")
+        outputs = await _triposg_infer(img_pil, seed, num_inference_steps, guidance_scale)
+        mesh = await asyncio.to_thread(_dit_mesh, outputs, faces)
 
         elapsed = time.time() - start
         log.info(f"TripoSG inference: {elapsed:.1f}s")
 
-        # Save GLB
+        # Save GLB after responding — downloads of it wait for the write
         part_id = f"gen_{uuid.uuid4().hex[:8]}"
         output_path = OUTPUT_DIR / f"{part_id}.glb"
-        mesh.export(str(output_path))
-        log.info(f"Saved GLB: {output_path} ({os.path.getsize(output_path)} bytes)")
 
-        return {
+        result = {
             "part_id": part_id,
             "glb_path": f"/parts/generated/{part_id}.glb",
             "vertices": len(mesh.vertices),
             "faces": len(mesh.faces),
             "elapsed_s": round(elapsed, 2),
         }
+        _pending_exports[output_path.name] = asyncio.Event()
+        background_tasks.add_task(_export_in_background, mesh, output_path, cache_key, result)
+        return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         log.error(f"Generation failed: {e}")
         import traceback
@@ -527,24 +1410,71 @@ async def generate_3d(
         raise HTTPException(500, f"Generation failed: {str(e)}")
 
 
-def _reduce_faces(mesh: trimesh.Trimesh, target_faces: int) -> trimesh.Trimesh:
-    """Reduce face count using pymeshlab if available."""
+def _mk_mesh(vertices, faces) -> trimesh.Trimesh:
+    """Build a Trimesh with no processing pass and no hidden copies.
+
+    Trimesh stores C-contiguous float64 vertices / int64 faces; arrays already
+    in that layout are wrapped as-is instead of being converted on assignment.
+    """
+    return trimesh.Trimesh(
+        vertices=np.ascontiguousarray(vertices, dtype=np.float64),
+        faces=np.ascontiguousarray(faces, dtype=np.int64),
+        process=False,
+    )
+
+
+def _dit_mesh(outputs, faces: int) -> trimesh.Trimesh:
+    """DiT (verts, faces) → Trimesh, reduced to `faces` if > 0. Blocking — call via asyncio.to_thread."""
+    # DiT output: vertices already unique, faces valid
+    return _reduce_faces(_mk_mesh(outputs[0], outputs[1]), faces)
+
+
+def _export_glb(mesh, output_path: Path, **kwargs) -> int:
+    """Serialize a mesh/scene to GLB bytes in memory and write them in one call.
+
+    Returns the file size so callers don't need to stat the file afterwards.
+    """
+    data = mesh.export(file_type="glb", **kwargs)
+    output_path.write_bytes(data)
+    return len(data)
+
+
+def _reduce_faces(
+    mesh: trimesh.Trimesh,
+    target_faces: int,
+    merge_close: bool = False,
+) -> trimesh.Trimesh:
+    """Reduce face count via quadric decimation.
+
+    Uses fast_simplification (one call over the NumPy buffers) and falls back
+    to pymeshlab if it isn't installed. DiT outputs already have unique
+    vertices, so the pymeshlab merge-close-vertices pass only runs when
+    `merge_close` is set.
+    """
     if target_faces <= 0 or mesh.faces.shape[0] <= target_faces:
         return mesh
     try:
-        import pymeshlab
-        ms = pymeshlab.MeshSet()
-        ms.add_mesh(pymeshlab.Mesh(
-            vertex_matrix=mesh.vertices,
-            face_matrix=mesh.faces,
-        ))
-        ms.meshing_merge_close_vertices()
-        ms.meshing_decimation_quadric_edge_collapse(targetfacenum=target_faces)
-        cm = ms.current_mesh()
-        mesh = trimesh.Trimesh(
-            vertices=cm.vertex_matrix(),
-            faces=cm.face_matrix(),
-        )
+        try:
+            import fast_simplification
+
+            verts, faces = fast_simplification.simplify(
+                np.asarray(mesh.vertices, dtype=np.float32),
+                np.asarray(mesh.faces),
+                target_count=target_faces,
+            )
+        except ImportError:
+            import pymeshlab
+            ms = pymeshlab.MeshSet()
+            ms.add_mesh(pymeshlab.Mesh(
+                vertex_matrix=mesh.vertices,
+                face_matrix=mesh.faces,
+            ))
+            if merge_close:
+                ms.meshing_merge_close_vertices()
+            ms.meshing_decimation_quadric_edge_collapse(targetfacenum=target_faces)
+            cm = ms.current_mesh()
+            verts, faces = cm.vertex_matrix(), cm.face_matrix()
+        mesh = _mk_mesh(verts, faces)
         log.info(f"Mesh simplified to {target_faces} faces")
     except Exception as e:
         log.warning(f"Face reduction failed, using full mesh: {e}")
@@ -565,6 +1495,22 @@ def _generate_hunyuan3d(
     """
     import torch
 
+    cache_key = _cache_key(
+        engine="hunyuan3d",
+        model=HUNYUAN3D_MODEL_ID,
+        prompt=prompt if image is None else None,
+        image=(
+            hashlib.sha256(image.tobytes()).hexdigest() + f"{image.mode}{image.size}"
+            if image is not None
+            else None
+        ),
+        save_ref=bool(prompt),
+        seed=seed,
+        faces=faces,
+    )
+    if (cached := _cache_get(cache_key)) is not None:
+        return cached
+
     pipe = get_hunyuan3d_model()
     if pipe is None:
         raise HTTPException(503, "Hunyuan3D model not available. Check installation.")
@@ -591,17 +1537,27 @@ def _generate_hunyuan3d(
     if image.mode != "RGBA":
         image = image.convert("RGBA")
 
+    part_id = f"h3d_{uuid.uuid4().hex[:8]}"
+
+    # Save ref image for painting — encoded on the I/O pool while the DiT runs
+    ref_save = None
+    if prompt:
+        paint_ref_id = f"paintref_{part_id}"
+        paint_ref_path = OUTPUT_DIR / f"{paint_ref_id}.png"
+        ref_save = _io_pool.submit(image.save, str(paint_ref_path))
+
     log.info(f"Hunyuan3D shape gen: image size={image.size}, seed={seed}")
 
     # Step 2: Image → 3D mesh
-    mesh = pipe(
-        image=image,
-        num_inference_steps=50,
-        octree_resolution=380,
-        num_chunks=20000,
-        generator=torch.manual_seed(seed),
-        output_type="trimesh",
-    )[0]  # Returns trimesh.Trimesh
+    with _attention_context():
+        mesh = pipe(
+            image=image,
+            num_inference_steps=50,
+            octree_resolution=380,
+            num_chunks=20000,
+            generator=torch.manual_seed(seed),
+            output_type="trimesh",
+        )[0]  # Returns trimesh.Trimesh
 
     # Optional face reduction
     mesh = _reduce_faces(mesh, faces)
@@ -613,10 +1569,9 @@ def _generate_hunyuan3d(
     )
 
     # Save GLB
-    part_id = f"h3d_{uuid.uuid4().hex[:8]}"
     output_path = OUTPUT_DIR / f"{part_id}.glb"
-    mesh.export(str(output_path))
-    log.info(f"Saved GLB: {output_path} ({os.path.getsize(output_path)} bytes)")
+    file_size = _export_glb(mesh, output_path)
+    log.info(f"Saved GLB: {output_path} ({file_size} bytes)")
 
     # Include ref image path if we generated one from text
     result = {
@@ -627,15 +1582,20 @@ def _generate_hunyuan3d(
         "elapsed_s": round(elapsed, 2),
         "engine": "hunyuan3d",
     }
-    if prompt and image is not None:
-        # Save ref image for painting (if text-to-image path was used)
-        paint_ref_id = f"paintref_{part_id}"
-        paint_ref_path = OUTPUT_DIR / f"{paint_ref_id}.png"
-        image.save(str(paint_ref_path))
+    if ref_save is not None:
+        ref_save.result()  # auto-paint reads it right after we return
+        _remember_ref_image(paint_ref_path, image)
         result["ref_image_path"] = f"/parts/generated/{paint_ref_id}.png"
+    _cache_put(cache_key, result)
     return result
 
 
+async def _run_hunyuan3d(**kwargs) -> dict:
+    """Run _generate_hunyuan3d on the GPU thread under MODEL_LOCK."""
+    async with MODEL_LOCK:
+        return await _gpu_call(_generate_hunyuan3d, **kwargs)
+
+
 # ── POST /generate-text — Text → 3D Mesh (Hunyuan3D) ────
 
 
@@ -646,9 +1606,7 @@ async def generate_text_3d(req: GenerateTextRequest):
         raise HTTPException(400, "Text prompt cannot be empty")
 
     try:
-        # Unload TripoSG to free VRAM for Hunyuan3D
-        unload_triposg()
-        return _generate_hunyuan3d(
+        return await _run_hunyuan3d(
             prompt=req.prompt.strip(),
             seed=req.seed,
             faces=req.faces,
@@ -664,38 +1622,104 @@ async def generate_text_3d(req: GenerateTextRequest):
 
 # ── POST /search-image — DuckDuckGo + rembg ─────────────
 
+# (query, remove_bg) → response, for the lifetime of the process
+SEARCH_CACHE_SIZE = 512
+_search_cache: OrderedDict[tuple[str, bool], dict] = OrderedDict()
+
+# Searches currently running, so concurrent identical queries (e.g. left/right
+# attachments in one /assemble) share one fetch + rembg pass
+_search_inflight: dict[tuple[str, bool], asyncio.Task] = {}
+
+# DDGS is a blocking client with one shared session (cookies + vqd tokens)
+# that isn't thread-safe — searches run off the loop, one at a time
+_ddgs_lock = threading.Lock()
+
+rembg_session = None
+
+
+def _ddgs_images(ddgs, query: str) -> list[dict]:
+    """Blocking DuckDuckGo image search on the shared session. Call via asyncio.to_thread."""
+    with _ddgs_lock:
+        return list(ddgs.images(query, max_results=5))
+
+
+def get_rembg_session():
+    """Lazy-create one rembg ONNX session (GPU if onnxruntime-gpu is installed).
+
+    rembg.remove() without a session builds a fresh InferenceSession per call.
+    ORT sessions are safe to run from several threads, so no lock is needed.
+    """
+    global rembg_session
+    if rembg_session is None:
+        import onnxruntime
+        from rembg import new_session
+
+        providers = [
+            p for p in ("CUDAExecutionProvider", "CPUExecutionProvider")
+            if p in onnxruntime.get_available_providers()
+        ]
+        rembg_session = new_session("u2net", providers=providers)
+        log.info(f"rembg session ready ({providers[0]})")
+    return rembg_session
+
 
 @app.post("/search-image")
 async def search_image(req: SearchImageRequest):
     """Search for a reference image and optionally remove background."""
-    try:
-        from duckduckgo_search import DDGS
+    ddgs = getattr(app.state, "ddgs", None)
+    http = getattr(app.state, "http", None)
+    if ddgs is None or http is None:
+        raise HTTPException(
+            503,
+            "duckduckgo_search not installed. pip install duckduckgo_search httpx",
+        )
 
+    cache_key = (req.query, req.remove_bg)
+    cached = _search_cache.get(cache_key)
+    if cached is not None and (OUTPUT_DIR / f"{cached['image_id']}.png").exists():
+        _search_cache.move_to_end(cache_key)
+        log.info(f"Search cache hit: {req.query}")
+        return cached
+
+    task = _search_inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_search_image_uncached(req, ddgs, http))
+        _search_inflight[cache_key] = task
+        task.add_done_callback(lambda _: _search_inflight.pop(cache_key, None))
+    else:
+        log.info(f"Joining in-flight search: {req.query}")
+    # shield: one caller disconnecting doesn't cancel the search for the others
+    return await asyncio.shield(task)
+
+
+async def _search_image_uncached(req: SearchImageRequest, ddgs, http) -> dict:
+    """Search + download + optional background removal; fills the search cache."""
+    cache_key = (req.query, req.remove_bg)
+    try:
         log.info(f"Searching images for: {req.query}")
-        with DDGS() as ddgs:
-            results = list(ddgs.images(req.query, max_results=5))
+        results = await asyncio.to_thread(_ddgs_images, ddgs, req.query)
 
         if not results:
             return {"images": [], "message": "No images found"}
 
         # Download first result
-        import httpx
-
         image_url = results[0]["image"]
         log.info(f"Downloading: {image_url}")
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(image_url)
-            resp.raise_for_status()
+        resp = await http.get(image_url)
+        resp.raise_for_status()
 
-        image = Image.open(BytesIO(resp.content)).convert("RGBA")
+        image = await asyncio.to_thread(
+            lambda: _decode_image(resp.content).convert("RGBA")
+        )
 
         # Remove background if requested
         if req.remove_bg:
             try:
                 import rembg
 
-                image = rembg.remove(image)
+                session = await asyncio.to_thread(get_rembg_session)
+                image = await asyncio.to_thread(rembg.remove, image, session=session)
                 log.info("Background removed")
             except ImportError:
                 log.warning("rembg not installed")
@@ -703,9 +1727,10 @@ async def search_image(req: SearchImageRequest):
         # Save to temp
         img_id = f"ref_{uuid.uuid4().hex[:8]}"
         img_path = OUTPUT_DIR / f"{img_id}.png"
-        image.save(str(img_path))
+        await asyncio.to_thread(image.save, str(img_path))
+        _remember_ref_image(img_path, image)
 
-        return {
+        result = {
             "image_id": img_id,
             "image_path": f"/parts/generated/{img_id}.png",
             "source_url": image_url,
@@ -714,12 +1739,11 @@ async def search_image(req: SearchImageRequest):
                 {"url": r["image"], "title": r.get("title", "")} for r in results[:5]
             ],
         }
+        _search_cache[cache_key] = result
+        if len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+        return result
 
-    except ImportError:
-        raise HTTPException(
-            503,
-            "duckduckgo_search not installed. pip install duckduckgo_search httpx",
-        )
     except Exception as e:
         log.error(f"Image search failed: {e}")
         raise HTTPException(500, f"Image search failed: {str(e)}")
@@ -733,39 +1757,44 @@ async def merge_parts(req: MergeRequest):
     """Merge multiple GLB parts into a single mesh using trimesh."""
     log.info(f"Merging {len(req.parts)} parts into '{req.output_name}'")
 
-    combined = trimesh.Scene()
-    for i, part in enumerate(req.parts):
-        part_path = PROJECT_ROOT / part["path"].lstrip("/")
-        if not part_path.exists():
-            raise HTTPException(404, f"Part not found: {part['path']}")
+    part_paths = [await resolve_glb(part["path"], "Part") for part in req.parts]
 
-        mesh = trimesh.load(str(part_path))
-        pos = part.get("position", [0, 0, 0])
-        rot = part.get("rotation", [0, 0, 0])
+    # One batched build for every part's transform
+    part_transforms = _transforms.build_transforms(
+        [part.get("position", [0, 0, 0]) for part in req.parts],
+        [part.get("rotation", [0, 0, 0]) for part in req.parts],
+    )
 
-        # Apply transform
-        transform = trimesh.transformations.compose_matrix(
-            translate=pos,
-            angles=[np.radians(r) for r in rot],
-        )
+    geoms: list[tuple[str, trimesh.Trimesh]] = []
+    transform_idx: list[int] = []
+    for i, part_path in enumerate(part_paths):
+        mesh = await asyncio.to_thread(trimesh.load, str(part_path))
 
         if isinstance(mesh, trimesh.Scene):
             for name, geom in mesh.geometry.items():
-                combined.add_geometry(geom, transform=transform, node_name=f"part_{i}_{name}")
+                geoms.append((f"part_{i}_{name}", geom))
+                transform_idx.append(i)
         else:
-            combined.add_geometry(mesh, transform=transform, node_name=f"part_{i}")
+            geoms.append((f"part_{i}", mesh))
+            transform_idx.append(i)
+    transforms = part_transforms[transform_idx]
 
-    # Export merged
     output_path = OUTPUT_DIR / f"{req.output_name}.glb"
-    combined.export(str(output_path))
-    log.info(
-        f"Merged mesh saved: {output_path} ({os.path.getsize(output_path)} bytes)"
-    )
+    if any(getattr(g.visual, "kind", None) == "texture" for _, g in geoms):
+        # Textured parts keep their own materials — merge as scene nodes
+        combined = trimesh.Scene()
+        for (name, geom), transform in zip(geoms, transforms):
+            combined.add_geometry(geom, transform=transform, node_name=name)
+        file_size = await asyncio.to_thread(_export_glb, combined, output_path)
+    else:
+        merged = await asyncio.to_thread(concat_meshes, [g for _, g in geoms], transforms)
+        file_size = await asyncio.to_thread(_export_glb, merged, output_path)
+    log.info(f"Merged mesh saved: {output_path} ({file_size} bytes)")
 
     return {
         "merged_path": f"/parts/generated/{req.output_name}.glb",
         "parts_count": len(req.parts),
-        "file_size": os.path.getsize(output_path),
+        "file_size": file_size,
     }
 
 
@@ -790,16 +1819,75 @@ SLOT_MAP: dict[str, list[float]] = {
 }
 
 
+# Frozen array form of SLOT_MAP so a whole request's slots resolve in one op
+SLOT_NAMES: list[str] = list(SLOT_MAP)
+SLOT_IDX: dict[str, int] = {name: i for i, name in enumerate(SLOT_NAMES)}
+SLOT_ARR: np.ndarray = np.asarray([SLOT_MAP[k] for k in SLOT_NAMES], dtype=np.float32)
+SLOT_ARR.flags.writeable = False
+
+
+def get_slot_positions(base_mesh: trimesh.Trimesh, slots: list[str]) -> np.ndarray:
+    """Calculate (N, 3) world positions for named slots on a mesh's bounding box."""
+    idxs = []
+    for slot in slots:
+        if slot not in SLOT_IDX:
+            log.warning(f"Unknown slot '{slot}', defaulting to 'top'")
+            slot = "top"
+        idxs.append(SLOT_IDX[slot])
+
+    # Plain-ndarray reductions; skips TrackedArray hashing behind mesh.bounds
+    V = base_mesh.vertices.view(np.ndarray)
+    bb_min, bb_max = V.min(axis=0), V.max(axis=0)
+    return bb_min + (bb_max - bb_min) * SLOT_ARR[idxs]
+
+
 def get_slot_position(base_mesh: trimesh.Trimesh, slot: str) -> np.ndarray:
     """Calculate world position for a named slot on a mesh's bounding box."""
-    if slot not in SLOT_MAP:
-        log.warning(f"Unknown slot '{slot}', defaulting to 'top'")
-        slot = "top"
+    return get_slot_positions(base_mesh, [slot])[0]
+
+
+def concat_meshes(
+    meshes: list[trimesh.Trimesh],
+    transforms: np.ndarray | None = None,
+) -> trimesh.Trimesh:
+    """Merge meshes into one Trimesh via single preallocated vertex/face buffers.
 
-    bb_min, bb_max = base_mesh.bounds  # [[min_x,y,z], [max_x,y,z]]
-    size = bb_max - bb_min
-    fracs = np.array(SLOT_MAP[slot])
-    return bb_min + size * fracs
+    `transforms` is an optional (K, 4, 4) stack of per-mesh transforms, applied
+    as one `V @ R.T + t` per part. Face/vertex colours are carried over; any
+    textured input sends the whole merge through trimesh.util.concatenate.
+    """
+    kinds = {getattr(m.visual, "kind", None) for m in meshes}
+    if "texture" in kinds:
+        if transforms is not None:
+            meshes = [m.copy().apply_transform(t) for m, t in zip(meshes, transforms)]
+        return trimesh.util.concatenate(meshes)
+
+    v_offsets = np.cumsum([0] + [len(m.vertices) for m in meshes])
+    f_offsets = np.cumsum([0] + [len(m.faces) for m in meshes])
+    vertices = np.empty((v_offsets[-1], 3), dtype=np.float64)
+    faces = np.empty((f_offsets[-1], 3), dtype=np.int64)
+
+    for k, m in enumerate(meshes):
+        v_out = vertices[v_offsets[k]:v_offsets[k + 1]]
+        if transforms is None:
+            v_out[:] = m.vertices
+        else:
+            np.matmul(m.vertices, transforms[k, :3, :3].T, out=v_out)
+            v_out += transforms[k, :3, 3]
+        np.add(m.faces, v_offsets[k], out=faces[f_offsets[k]:f_offsets[k + 1]])
+
+    merged = _mk_mesh(vertices, faces)
+    if kinds == {None}:
+        return merged
+
+    # Uncoloured parts contribute trimesh's default colour, as concatenate does
+    if kinds <= {None, "vertex"}:
+        colors = np.concatenate([m.visual.vertex_colors for m in meshes])
+        merged.visual = trimesh.visual.ColorVisuals(merged, vertex_colors=colors)
+    else:
+        colors = np.concatenate([m.visual.face_colors for m in meshes])
+        merged.visual = trimesh.visual.ColorVisuals(merged, face_colors=colors)
+    return merged
 
 
 def extract_single_mesh(loaded) -> trimesh.Trimesh:
@@ -811,13 +1899,62 @@ def extract_single_mesh(loaded) -> trimesh.Trimesh:
         meshes = list(loaded.geometry.values())
         if len(meshes) == 1:
             return meshes[0]
-        return trimesh.util.concatenate(meshes)
+        return concat_meshes(meshes)
     raise ValueError("Could not extract a valid mesh from the loaded file")
 
 
+def load_mesh(glb_path: Path) -> trimesh.Trimesh:
+    """Load a GLB from disk as a single Trimesh. Blocking — call via asyncio.to_thread."""
+    return extract_single_mesh(trimesh.load(str(glb_path)))
+
+
+def _surface_centroid(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted surface centroid (what `Trimesh.centroid` returns) on plain arrays."""
+    tri = vertices[faces]
+    area = np.linalg.norm(np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0]), axis=1)
+    total = area.sum()
+    if total == 0:
+        return vertices.mean(axis=0)
+    return (tri.mean(axis=1) * area[:, None]).sum(axis=0) / total
+
+
+def load_positioned_mesh(glb_path: Path, scale: float, slot_pos: np.ndarray) -> trimesh.Trimesh:
+    """Load an attachment GLB, scale it, and center it on `slot_pos`. Blocking."""
+    mesh = load_mesh(glb_path)
+
+    # Work on plain ndarrays: each apply_*/centroid call on the Trimesh
+    # re-hashes the TrackedArray vertex buffer and rebuilds cached properties
+    V = mesh.vertices.view(np.ndarray)
+    F = mesh.faces.view(np.ndarray)
+
+    # Scale attachment relative to base
+    if scale != 1.0:
+        V = V * scale
+
+    # Center attachment on the slot, then write back once (one cache invalidation)
+    mesh.vertices = V + (slot_pos - _surface_centroid(V, F))
+    return mesh
+
+
 # ── POST /assemble — Full LLM-Driven Assembly ────────────
 
 
+async def _gather_or_cancel(*aws) -> list:
+    """asyncio.gather that cancels the other awaitables as soon as one fails.
+
+    Plain gather leaves siblings running (and queuing GPU work) with nobody
+    left to collect the result once the request has errored out.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 @app.post("/assemble")
 async def assemble_bot(req: AssembleRequest):
     """Orchestrate full assembly: generate parts → position at slots → merge → optional rig."""
@@ -827,15 +1964,12 @@ async def assemble_bot(req: AssembleRequest):
     try:
         # ── Step 1: Get or generate base mesh ──
         if req.base_glb_path:
-            base_path = PROJECT_ROOT / req.base_glb_path.lstrip("/")
-            if not base_path.exists():
-                raise HTTPException(404, f"Base GLB not found: {req.base_glb_path}")
+            base_path = await resolve_glb(req.base_glb_path, "Base GLB")
             log.info(f"Using existing base GLB: {base_path}")
         elif req.base_text_prompt and req.base_engine == "hunyuan3d":
             # Text-to-3D via Hunyuan3D
             log.info(f"Generating base mesh from text: '{req.base_text_prompt}'")
-            unload_triposg()  # Free VRAM for Hunyuan3D
-            base_result = _generate_hunyuan3d(prompt=req.base_text_prompt)
+            base_result = await _run_hunyuan3d(prompt=req.base_text_prompt)
             base_path = OUTPUT_DIR / f"{base_result['part_id']}.glb"
             # Save ref image path for auto-paint later
             base_ref_image = base_result.get("ref_image_path", "")
@@ -855,12 +1989,14 @@ async def assemble_bot(req: AssembleRequest):
 
             log.info(f"Generating base mesh from image (engine={req.base_engine})...")
             if req.base_engine == "hunyuan3d":
-                unload_triposg()
-                img = Image.open(PROJECT_ROOT / base_image_path.lstrip("/"))
-                base_result = _generate_hunyuan3d(image=img)
+                img = await asyncio.to_thread(
+                    Image.open, PROJECT_ROOT / base_image_path.lstrip("/")
+                )
+                base_result = await _run_hunyuan3d(image=img)
             else:
-                with open(PROJECT_ROOT / base_image_path.lstrip("/"), "rb") as f:
-                    image_data = f.read()
+                image_data = await asyncio.to_thread(
+                    (PROJECT_ROOT / base_image_path.lstrip("/")).read_bytes
+                )
                 base_result = await _generate_from_bytes(
                     image_data, "base.png",
                     num_inference_steps=req.num_inference_steps,
@@ -870,27 +2006,32 @@ async def assemble_bot(req: AssembleRequest):
             generated_parts.append({"role": "base", **base_result})
 
         # Load base mesh
-        base_loaded = trimesh.load(str(base_path))
-        base_mesh = extract_single_mesh(base_loaded)
+        base_mesh = await asyncio.to_thread(load_mesh, base_path)
         log.info(f"Base mesh: {len(base_mesh.vertices)} verts, bounds={base_mesh.bounds.tolist()}")
 
         # ── Step 2: Generate + position attachments ──
         positioned_meshes = [base_mesh]  # Start with base
+        slot_positions = get_slot_positions(base_mesh, [att.slot for att in req.attachments])
+
+        def _part_info(att: AttachmentPart, att_result: dict) -> tuple[Path, dict]:
+            att_path = OUTPUT_DIR / f"{att_result['part_id']}.glb"
+            return att_path, {"role": att.description, "slot": att.slot, **att_result}
 
-        for i, att in enumerate(req.attachments):
+        async def _make_attachment(i: int, att: AttachmentPart):
+            """Resolve one attachment to (glb_path, generated_part | None), or None to skip.
+
+            TripoSG attachments return their raw image bytes instead; they are
+            generated together in one batch once every input is ready.
+            """
             log.info(f"Processing attachment {i+1}/{len(req.attachments)}: '{att.description}' → slot '{att.slot}'")
 
             if att.glb_path:
-                att_path = PROJECT_ROOT / att.glb_path.lstrip("/")
-                if not att_path.exists():
-                    raise HTTPException(404, f"Attachment GLB not found: {att.glb_path}")
-            elif att.text_prompt and att.engine == "hunyuan3d":
+                return await resolve_glb(att.glb_path, "Attachment GLB"), None
+
+            if att.text_prompt and att.engine == "hunyuan3d":
                 # Text-to-3D via Hunyuan3D for this attachment
                 log.info(f"Generating '{att.description}' from text: '{att.text_prompt}'")
-                unload_triposg()
-                att_result = _generate_hunyuan3d(prompt=att.text_prompt)
-                att_path = OUTPUT_DIR / f"{att_result['part_id']}.glb"
-                generated_parts.append({"role": att.description, "slot": att.slot, **att_result})
+                att_result = await _run_hunyuan3d(prompt=att.text_prompt)
             else:
                 # Image-to-3D path
                 att_image_path = att.image_path
@@ -902,50 +2043,71 @@ async def assemble_bot(req: AssembleRequest):
 
                 if not att_image_path:
                     log.warning(f"Skipping attachment '{att.description}': no image or text prompt")
-                    continue
+                    return None
 
                 log.info(f"Generating mesh for '{att.description}' (engine={att.engine})...")
                 if att.engine == "hunyuan3d":
-                    unload_triposg()
-                    img = Image.open(PROJECT_ROOT / att_image_path.lstrip("/"))
-                    att_result = _generate_hunyuan3d(image=img)
+                    img = await asyncio.to_thread(
+                        Image.open, PROJECT_ROOT / att_image_path.lstrip("/")
+                    )
+                    att_result = await _run_hunyuan3d(image=img)
                 else:
-                    with open(PROJECT_ROOT / att_image_path.lstrip("/"), "rb") as f:
-                        att_data = f.read()
-                    att_result = await _generate_from_bytes(
-                        att_data, f"att_{i}.png",
-                        num_inference_steps=req.num_inference_steps,
-                        guidance_scale=req.guidance_scale,
+                    return await asyncio.to_thread(
+                        (PROJECT_ROOT / att_image_path.lstrip("/")).read_bytes
                     )
-                att_path = OUTPUT_DIR / f"{att_result['part_id']}.glb"
-                generated_parts.append({"role": att.description, "slot": att.slot, **att_result})
 
-            # Load attachment mesh
-            att_loaded = trimesh.load(str(att_path))
-            att_mesh = extract_single_mesh(att_loaded)
+            return _part_info(att, att_result)
 
-            # Scale attachment relative to base
-            if att.scale != 1.0:
-                att_mesh.apply_scale(att.scale)
+        # Searches/downloads overlap freely; Hunyuan3D work is serialized
+        made = await _gather_or_cancel(
+            *[_make_attachment(i, att) for i, att in enumerate(req.attachments)]
+        )
 
-            # Calculate slot position and center attachment there
-            slot_pos = get_slot_position(base_mesh, att.slot)
-            att_center = att_mesh.centroid
-            translation = slot_pos - att_center
-            att_mesh.apply_translation(translation)
-            log.info(f"Positioned '{att.description}' at slot '{att.slot}': {slot_pos.tolist()}")
+        # All TripoSG attachments denoise together in one batched pipe() call
+        triposg_idx = [i for i, item in enumerate(made) if isinstance(item, bytes)]
+        if triposg_idx:
+            log.info(f"Generating {len(triposg_idx)} TripoSG attachment(s) as one batch...")
+            batch_results = await _generate_from_bytes_batch(
+                [(made[i], f"att_{i}.png") for i in triposg_idx],
+                num_inference_steps=req.num_inference_steps,
+                guidance_scale=req.guidance_scale,
+            )
+            for i, att_result in zip(triposg_idx, batch_results):
+                made[i] = _part_info(req.attachments[i], att_result)
+
+        # Load + position all attachments in parallel on the I/O pool
+        placed = [
+            (i, att, item)
+            for i, (att, item) in enumerate(zip(req.attachments, made))
+            if item is not None
+        ]
+        loop = asyncio.get_running_loop()
+        att_meshes = await _gather_or_cancel(*[
+            loop.run_in_executor(
+                _io_pool, load_positioned_mesh, att_path, att.scale, slot_positions[i]
+            )
+            for i, att, (att_path, _) in placed
+        ])
 
+        for (i, att, (_, part_info)), att_mesh in zip(placed, att_meshes):
+            if part_info is not None:
+                generated_parts.append(part_info)
+            log.info(f"Positioned '{att.description}' at slot '{att.slot}': {slot_positions[i].tolist()}")
             positioned_meshes.append(att_mesh)
 
-        # ── Unload shape models before merge — not needed anymore ──
-        unload_hunyuan3d()
-        unload_triposg()
-
         # ── Step 3: Merge all parts ──
         log.info(f"Merging {len(positioned_meshes)} meshes...")
-        merged = trimesh.util.concatenate(positioned_meshes)
         merged_path = OUTPUT_DIR / f"{req.output_name}.glb"
-        merged.export(str(merged_path))
+        if any(getattr(m.visual, "kind", None) is not None for m in positioned_meshes):
+            # Textured or coloured parts (user-supplied GLBs) need trimesh to merge visuals
+            merged = await asyncio.to_thread(trimesh.util.concatenate, positioned_meshes)
+            file_size = await asyncio.to_thread(_export_glb, merged, merged_path)
+        else:
+            # Clean generated geometry: one preallocated buffer, no process pass
+            merged = await asyncio.to_thread(concat_meshes, positioned_meshes)
+            file_size = await asyncio.to_thread(
+                _export_glb, merged, merged_path, include_normals=False
+            )
         log.info(f"Merged mesh: {len(merged.vertices)} verts, {len(merged.faces)} faces")
 
         result = {
@@ -953,9 +2115,13 @@ async def assemble_bot(req: AssembleRequest):
             "vertices": len(merged.vertices),
             "faces": len(merged.faces),
             "parts_generated": generated_parts,
-            "file_size": os.path.getsize(merged_path),
+            "file_size": file_size,
         }
 
+        # The merged GLB is on disk — drop the in-memory parts before rig/paint
+        # so they don't sit in RAM through the ~10GB paint stage
+        del merged, positioned_meshes, att_meshes, placed, made, base_mesh
+
         # ── Step 4: Optional auto-rig (non-fatal) ──
         if req.auto_rig:
             try:
@@ -1018,76 +2184,235 @@ async def _generate_from_bytes(
     faces: int = -1,
 ) -> dict:
     """Internal helper: run TripoSG on raw image bytes. Returns result dict."""
-    import torch
-    from image_process import prepare_image
-    import tempfile
-
-    pipe, rmbg = get_triposg_models()
-    if pipe is None:
-        raise HTTPException(503, "TripoSG model not available")
+    results = await _generate_from_bytes_batch(
+        [(image_bytes, filename)],
+        num_inference_steps=num_inference_steps,
+        guidance_scale=guidance_scale,
+        seed=seed,
+        faces=faces,
+    )
+    return results[0]
 
-    image = Image.open(BytesIO(image_bytes))
-    log.info(f"  _generate_from_bytes: {filename} ({image.size[0]}x{image.size[1]})")
 
-    # Save to temp file for prepare_image
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        image.save(tmp, format="PNG")
-        tmp_path = tmp.name
+async def _generate_from_bytes_batch(
+    images: list[tuple[bytes, str]],
+    num_inference_steps: int = 50,
+    guidance_scale: float = 7.0,
+    seed: int = 42,
+    faces: int = -1,
+) -> list[dict]:
+    """Run TripoSG on several (image_bytes, filename) inputs as one batched forward.
 
-    try:
-        img_pil = prepare_image(
-            tmp_path,
-            bg_color=np.array([1.0, 1.0, 1.0]),
-            rmbg_net=rmbg,
+    Returns result dicts in input order. Cached and duplicate images are
+    resolved without extra GPU work; the rest are decoded in parallel,
+    preprocessed in turn and queued together so the batcher runs them as a
+    single pipe() call.
+    """
+    keys = [
+        _cache_key(
+            engine="triposg",
+            image=hashlib.sha256(image_bytes).hexdigest(),
+            seed=seed,
+            steps=num_inference_steps,
+            guidance=guidance_scale,
+            faces=faces,
         )
-    finally:
-        os.unlink(tmp_path)
+        for image_bytes, _ in images
+    ]
+    done: dict[str, dict] = {}
+    todo: dict[str, tuple[bytes, str]] = {}
+    for key, item in zip(keys, images):
+        if key in done or key in todo:
+            continue
+        if (cached := _cache_get(key)) is not None:
+            done[key] = cached
+        else:
+            todo[key] = item
+    if not todo:
+        return [done[key] for key in keys]
+
+    # Decode in parallel; the on-device preprocessing below runs one at a time
+    decoded = await asyncio.gather(*[
+        asyncio.to_thread(_decode_image, image_bytes) for image_bytes, _ in todo.values()
+    ])
+    for (_, filename), image in zip(todo.values(), decoded):
+        log.info(f"  _generate_from_bytes: {filename} ({image.size[0]}x{image.size[1]})")
+
+    # RMBG must stay resident while preprocessing; the DiT forward takes the
+    # lock inside the batcher
+    async with _resident("triposg", get_triposg_models) as (pipe, rmbg):
+        if pipe is None:
+            raise HTTPException(503, "TripoSG model not available")
+        img_pils = [await _prep_call(_preprocess_image, image, rmbg) for image in decoded]
 
     start = time.time()
-    with torch.no_grad():
-        outputs = pipe(
-            image=img_pil,
-            generator=torch.Generator(device=pipe.device).manual_seed(seed),
-            num_inference_steps=num_inference_steps,
-            guidance_scale=guidance_scale,
-        ).samples[0]
-
-    mesh = trimesh.Trimesh(
-        outputs[0].astype(np.float32),
-        np.ascontiguousarray(outputs[1]),
+    samples = await _triposg_infer_many(img_pils, seed, num_inference_steps, guidance_scale)
+
+    def _finish(outputs) -> dict:
+        mesh = _dit_mesh(outputs, faces)
+
+        part_id = f"gen_{uuid.uuid4().hex[:8]}"
+        _export_glb(mesh, OUTPUT_DIR / f"{part_id}.glb")
+        return {
+            "part_id": part_id,
+            "glb_path": f"/parts/generated/{part_id}.glb",
+            "vertices": len(mesh.vertices),
+            "faces": len(mesh.faces),
+            "elapsed_s": round(time.time() - start, 2),
+        }
+
+    # Per-sample face reduction + export run in parallel
+    finished = await asyncio.gather(*[asyncio.to_thread(_finish, o) for o in samples])
+    for key, result in zip(todo, finished):
+        _cache_put(key, result)
+        done[key] = result
+    return [done[key] for key in keys]
+
+
+# ── UniRig worker ───────────────────────────────────────
+
+# UniRig uses its own Conda environment
+UNIRIG_PYTHON = Path(r"D:\Miniconda3\envs\UniRig\python.exe")
+UNIRIG_WORKER = Path(__file__).resolve().parent / "unirig_worker.py"
+UNIRIG_TIMEOUT_S = 300  # 5min timeout for large meshes
+
+# One long-lived UniRig interpreter serves every /rig call over JSON lines (see
+# unirig_worker.py), started on first use and restarted if it dies.
+# UNIRIG_PERSISTENT=0 goes back to one process per call.
+UNIRIG_PERSISTENT = os.environ.get("UNIRIG_PERSISTENT", "1") != "0"
+
+_unirig_proc: asyncio.subprocess.Process | None = None
+_unirig_lock = asyncio.Lock()  # one job at a time through the worker's pipes
+
+
+async def _start_unirig_worker(rig_wrapper: Path) -> asyncio.subprocess.Process:
+    """Spawn the worker and wait for its ready line (torch + CUDA initialized)."""
+    log.info("Starting persistent UniRig worker...")
+    proc = await asyncio.create_subprocess_exec(
+        str(UNIRIG_PYTHON),
+        str(UNIRIG_WORKER),
+        str(rig_wrapper),
+        cwd=str(UNIRIG_DIR),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,  # replies only; worker logs go to stderr
     )
+    try:
+        line = await asyncio.wait_for(proc.stdout.readline(), timeout=UNIRIG_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        line = b""
+    except BaseException:
+        proc.kill()
+        await proc.wait()
+        raise
+    if not line or json.loads(line).get("status") != "ready":
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        raise HTTPException(503, f"UniRig worker failed to start (exit {proc.returncode})")
+    log.info("UniRig worker ready")
+    return proc
+
+
+async def _unirig_request(rig_wrapper: Path, input_path: Path, output_path: Path) -> dict:
+    """Run one rig job on the persistent worker, (re)starting it if needed."""
+    global _unirig_proc
+    async with _unirig_lock:
+        if _unirig_proc is not None and _unirig_proc.returncode is not None:
+            log.warning(f"UniRig worker exited ({_unirig_proc.returncode}), restarting")
+            _unirig_proc = None
+        if _unirig_proc is None:
+            _unirig_proc = await _start_unirig_worker(rig_wrapper)
+
+        proc = _unirig_proc
+        job = {"input": str(input_path), "output": str(output_path)}
+        try:
+            proc.stdin.write((json.dumps(job) + "\n").encode())
+            await proc.stdin.drain()
+            line = await asyncio.wait_for(proc.stdout.readline(), timeout=UNIRIG_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            # The job may still be running — the only way to stop it is to kill the worker
+            proc.kill()
+            await proc.wait()
+            _unirig_proc = None
+            raise HTTPException(504, f"Rigging timed out ({UNIRIG_TIMEOUT_S}s limit)")
+        except (BrokenPipeError, ConnectionResetError):
+            line = b""
+        except BaseException:
+            # Cancelled mid-job: the worker is still busy and its reply would
+            # be read by the next request, so drop it rather than desync
+            proc.kill()
+            await proc.wait()
+            _unirig_proc = None
+            raise
+
+        if not line:
+            await proc.wait()
+            _unirig_proc = None
+            raise HTTPException(500, f"UniRig worker crashed (exit {proc.returncode})")
+        return json.loads(line)
+
+
+async def _run_unirig(rig_wrapper: Path, glb_path: Path, output_glb: Path) -> None:
+    """Rig one GLB via the persistent worker (or a one-shot process). Raises HTTPException."""
+    if UNIRIG_PERSISTENT:
+        log.info(f"Running UniRig pipeline on persistent worker: {glb_path.name}")
+        reply = await _unirig_request(rig_wrapper, glb_path, output_glb)
+        if reply.get("status") != "ok":
+            error = reply.get("error") or "unknown error"
+            log.error(f"UniRig failed: {error[-500:]}")
+            raise HTTPException(500, f"UniRig rigging failed: {error[-500:]}")
+    else:
+        cmd = [
+            str(UNIRIG_PYTHON),
+            str(rig_wrapper),
+            f"--input={str(glb_path)}",
+            f"--output={str(output_glb)}",
+        ]
+        log.info(f"Running UniRig pipeline: {' '.join(cmd[:3])}...")
 
-    # Optional face reduction
-    if faces > 0 and mesh.faces.shape[0] > faces:
+        # Async subprocess — the event loop keeps serving other requests
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(UNIRIG_DIR),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
         try:
-            import pymeshlab
-            ms = pymeshlab.MeshSet()
-            ms.add_mesh(pymeshlab.Mesh(
-                vertex_matrix=mesh.vertices,
-                face_matrix=mesh.faces,
-            ))
-            ms.meshing_merge_close_vertices()
-            ms.meshing_decimation_quadric_edge_collapse(targetfacenum=faces)
-            cm = ms.current_mesh()
-            mesh = trimesh.Trimesh(
-                vertices=cm.vertex_matrix(),
-                faces=cm.face_matrix(),
+            stdout_b, stderr_b = await asyncio.wait_for(
+                proc.communicate(), timeout=UNIRIG_TIMEOUT_S
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise HTTPException(504, f"Rigging timed out ({UNIRIG_TIMEOUT_S}s limit)")
+        stdout = stdout_b.decode(errors="replace")
+        stderr = stderr_b.decode(errors="replace")
+
+        if stdout:
+            log.info(f"UniRig stdout:\n{stdout[-500:]}")
+        if stderr:
+            log.warning(f"UniRig stderr:\n{stderr[-500:]}")
+
+        if proc.returncode != 0:
+            log.error(f"UniRig failed (exit {proc.returncode})")
+            raise HTTPException(
+                500,
+                f"UniRig rigging failed: {stderr[-500:] if stderr else 'unknown error'}",
             )
-        except Exception as e:
-            log.warning(f"Face reduction failed: {e}")
 
-    elapsed = time.time() - start
-    part_id = f"gen_{uuid.uuid4().hex[:8]}"
-    output_path = OUTPUT_DIR / f"{part_id}.glb"
-    mesh.export(str(output_path))
 
-    return {
-        "part_id": part_id,
-        "glb_path": f"/parts/generated/{part_id}.glb",
-        "vertices": len(mesh.vertices),
-        "faces": len(mesh.faces),
-        "elapsed_s": round(elapsed, 2),
-    }
+async def _stop_unirig_worker() -> None:
+    """Close the worker's stdin (it exits on EOF); kill it if it doesn't."""
+    global _unirig_proc
+    proc, _unirig_proc = _unirig_proc, None
+    if proc is None or proc.returncode is not None:
+        return
+    proc.stdin.close()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
 
 
 # ── POST /rig — Auto-Rig via UniRig ─────────────────────
@@ -1096,24 +2421,12 @@ async def _generate_from_bytes(
 @app.post("/rig")
 async def rig_bot(req: RigRequest):
     """Auto-rig a GLB mesh using the UniRig pipeline."""
-    # Web paths like /parts/generated/X.glb map to public/parts/generated/X.glb
-    raw_path = req.glb_path.lstrip("/")
-    glb_path = PROJECT_ROOT / "public" / raw_path
-    if not glb_path.exists():
-        # Fallback: try without public/ prefix
-        glb_path = PROJECT_ROOT / raw_path
-    if not glb_path.exists():
-        raise HTTPException(404, f"GLB not found: {req.glb_path}")
-
-    # Ensure TripoSG is unloaded (UniRig needs VRAM)
-    unload_triposg()
+    glb_path = await resolve_glb(req.glb_path)
 
     log.info(f"Rigging: {glb_path}")
 
     try:
-        # UniRig uses its own Conda environment
-        unirig_python = Path(r"D:\Miniconda3\envs\UniRig\python.exe")
-        if not unirig_python.exists():
+        if not UNIRIG_PYTHON.exists():
             raise HTTPException(
                 503,
                 "UniRig Conda env not found at D:\\Miniconda3\\envs\\UniRig. "
@@ -1131,33 +2444,10 @@ async def rig_bot(req: RigRequest):
         # 2. Predict skeleton → .fbx
         # 3. Predict skin weights → .fbx
         # 4. Merge → rigged .glb
-        cmd = [
-            str(unirig_python),
-            str(rig_wrapper),
-            f"--input={str(glb_path)}",
-            f"--output={str(output_glb)}",
-        ]
-        log.info(f"Running UniRig pipeline: {' '.join(cmd[:3])}...")
-
-        result = subprocess.run(
-            cmd,
-            cwd=str(UNIRIG_DIR),
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5min timeout for large meshes
-        )
-
-        if result.stdout:
-            log.info(f"UniRig stdout:\n{result.stdout[-500:]}")
-        if result.stderr:
-            log.warning(f"UniRig stderr:\n{result.stderr[-500:]}")
-
-        if result.returncode != 0:
-            log.error(f"UniRig failed (exit {result.returncode})")
-            raise HTTPException(
-                500,
-                f"UniRig rigging failed: {result.stderr[-500:] if result.stderr else 'unknown error'}",
-            )
+        async with MODEL_LOCK:
+            # UniRig runs in its own process — make sure it has VRAM to work with
+            await _gpu_call(make_room_for, "unirig")
+            await _run_unirig(rig_wrapper, glb_path, output_glb)
 
         # Check output
         response: dict = {
@@ -1176,8 +2466,6 @@ async def rig_bot(req: RigRequest):
 
         return response
 
-    except subprocess.TimeoutExpired:
-        raise HTTPException(504, "Rigging timed out (300s limit)")
     except HTTPException:
         raise
     except Exception as e:
@@ -1188,16 +2476,54 @@ async def rig_bot(req: RigRequest):
 # ── POST /paint — Texture via Hunyuan3D-Paint ────────────
 
 
+# Decoded reference images by (path, mtime). Images this process just wrote
+# (search results, Hunyuan3D text→image refs) are registered as they're saved,
+# so chained assemble → paint flows skip the PNG decode entirely.
+REF_IMAGE_CACHE_SIZE = 8
+_ref_image_cache: OrderedDict[tuple[str, int], Image.Image] = OrderedDict()
+# Touched from the loop and from to_thread workers alike
+_ref_image_lock = threading.Lock()
+
+
+def _ref_image_key(path: Path) -> tuple[str, int]:
+    return str(path.resolve()), path.stat().st_mtime_ns
+
+
+def _remember_ref_image(path: Path, image: Image.Image) -> None:
+    """Register an RGBA image that was just saved to `path`."""
+    key = _ref_image_key(path)
+    image = image.convert("RGBA") if image.mode != "RGBA" else image
+    with _ref_image_lock:
+        _ref_image_cache[key] = image
+        _ref_image_cache.move_to_end(key)
+        while len(_ref_image_cache) > REF_IMAGE_CACHE_SIZE:
+            _ref_image_cache.popitem(last=False)
+
+
+def _run_paint(paint_pipe, mesh, image):
+    """Blocking texture pass under the same SDPA backend selection as shape gen."""
+    with _attention_context():
+        return paint_pipe(mesh, image=image)
+
+
+def _load_rgba(path: Path) -> Image.Image:
+    """Decode an image file to RGBA, reusing an in-memory copy if unchanged. Blocking."""
+    key = _ref_image_key(path)
+    with _ref_image_lock:
+        image = _ref_image_cache.get(key)
+        if image is not None:
+            _ref_image_cache.move_to_end(key)
+            return image
+    with Image.open(path) as im:
+        image = im.convert("RGBA")
+    _remember_ref_image(path, image)
+    return image
+
+
 @app.post("/paint")
 async def paint_bot(req: PaintRequest):
     """Apply AI-generated textures to a GLB mesh using Hunyuan3D-Paint."""
-    # Resolve GLB path (web path → disk path)
-    raw_path = req.glb_path.lstrip("/")
-    glb_path = PROJECT_ROOT / "public" / raw_path
-    if not glb_path.exists():
-        glb_path = PROJECT_ROOT / raw_path
-    if not glb_path.exists():
-        raise HTTPException(404, f"GLB not found: {req.glb_path}")
+    glb_path = await resolve_glb(req.glb_path)
 
     log.info(f"Painting: {glb_path}")
 
@@ -1209,7 +2535,7 @@ async def paint_bot(req: PaintRequest):
             if not img_path.exists():
                 img_path = PROJECT_ROOT / req.image_path.lstrip("/")
             if img_path.exists():
-                ref_image = Image.open(img_path).convert("RGBA")
+                ref_image = await asyncio.to_thread(_load_rgba, img_path)
                 log.info(f"Using reference image: {img_path}")
 
         if ref_image is None and req.search_query:
@@ -1222,7 +2548,7 @@ async def paint_bot(req: PaintRequest):
                 if not img_path.exists():
                     img_path = PROJECT_ROOT / found_path.lstrip("/")
                 if img_path.exists():
-                    ref_image = Image.open(img_path).convert("RGBA")
+                    ref_image = await asyncio.to_thread(_load_rgba, img_path)
                     log.info(f"Using searched image: {img_path}")
 
         if ref_image is None:
@@ -1233,18 +2559,8 @@ async def paint_bot(req: PaintRequest):
                 "for texture guidance.",
             )
 
-        # Free shape model VRAM — paint model needs ~10GB
-        unload_hunyuan3d()
-        unload_triposg()
-
-        # Load paint pipeline
-        paint_pipe = get_hunyuan3d_paint()
-        if paint_pipe is None:
-            raise HTTPException(503, "Hunyuan3D-Paint not available")
-
         # Load mesh
-        loaded = trimesh.load(str(glb_path))
-        mesh = extract_single_mesh(loaded)
+        mesh = await asyncio.to_thread(load_mesh, glb_path)
         log.info(
             f"Loaded mesh for painting: {len(mesh.vertices)} verts, "
             f"{len(mesh.faces)} faces"
@@ -1257,33 +2573,35 @@ async def paint_bot(req: PaintRequest):
                 f"Mesh too large for painting ({len(mesh.faces)} faces), "
                 f"decimating to {MAX_PAINT_FACES}..."
             )
-            try:
-                mesh = mesh.simplify_quadric_decimation(
-                    face_count=MAX_PAINT_FACES
-                )
-                log.info(
-                    f"Decimated mesh: {len(mesh.vertices)} verts, "
-                    f"{len(mesh.faces)} faces"
-                )
-            except Exception as dec_err:
-                log.warning(f"Decimation failed, using original: {dec_err}")
+            # Same C++ quadric path as /generate (falls back to the original on error)
+            mesh = await asyncio.to_thread(_reduce_faces, mesh, MAX_PAINT_FACES)
+            log.info(
+                f"Decimated mesh: {len(mesh.vertices)} verts, "
+                f"{len(mesh.faces)} faces"
+            )
 
-        # Run texture generation
-        t0 = time.time()
-        log.info("Running Hunyuan3D-Paint texture generation...")
-        textured_mesh = paint_pipe(mesh, image=ref_image)
-        elapsed = time.time() - t0
-        log.info(f"Texture generation complete: {elapsed:.1f}s")
+        async with MODEL_LOCK:
+            try:
+                # Load paint pipeline (evicts shape models only if ~10GB isn't free)
+                paint_pipe = await _gpu_call(get_hunyuan3d_paint)
+                if paint_pipe is None:
+                    raise HTTPException(503, "Hunyuan3D-Paint not available")
+
+                # Run texture generation
+                t0 = time.time()
+                log.info("Running Hunyuan3D-Paint texture generation...")
+                textured_mesh = await _gpu_call(_run_paint, paint_pipe, mesh, ref_image)
+                elapsed = time.time() - t0
+                log.info(f"Texture generation complete: {elapsed:.1f}s")
+            finally:
+                # Free paint model VRAM immediately — it's huge (~10GB)
+                await _gpu_call(unload_hunyuan3d_paint)
 
         # Export textured GLB
         output_path = OUTPUT_DIR / f"{req.output_name}.glb"
-        textured_mesh.export(str(output_path))
-        file_size = os.path.getsize(output_path)
+        file_size = await asyncio.to_thread(_export_glb, textured_mesh, output_path)
         log.info(f"Saved textured GLB: {output_path} ({file_size} bytes)")
 
-        # Free paint model VRAM immediately — it's huge (~10GB)
-        unload_hunyuan3d_paint()
-
         return {
             "painted_path": f"/parts/generated/{req.output_name}.glb",
             "file_size": file_size,
@@ -1292,10 +2610,8 @@ async def paint_bot(req: PaintRequest):
         }
 
     except HTTPException:
-        unload_hunyuan3d_paint()
         raise
     except Exception as e:
-        unload_hunyuan3d_paint()
         log.error(f"Painting failed: {e}")
         import traceback
         traceback.print_exc()
@@ -1305,13 +2621,32 @@ async def paint_bot(req: PaintRequest):
 # ── Static file serving for generated parts ──────────────
 
 
-@app.get("/parts/generated/{filename}")
-async def serve_generated(filename: str):
-    """Serve generated files from the output directory."""
-    file_path = OUTPUT_DIR / filename
-    if not file_path.exists():
-        raise HTTPException(404, f"File not found: {filename}")
-    return FileResponse(str(file_path))
+# Parts/refs get a fresh uuid per generation, so their bytes never change.
+# Named outputs (output_name, e.g. assembled_bot.glb) are overwritten in place.
+IMMUTABLE_PREFIXES = ("gen_", "h3d_", "ref_", "paintref_")
+
+
+class GeneratedFiles(StaticFiles):
+    """StaticFiles (ETag/304, Range) with long-lived caching on uuid-named parts.
+
+    Requests for a GLB that /generate is still writing wait for the export.
+    """
+
+    async def get_response(self, path: str, scope):
+        if not await _wait_for_export(os.path.basename(path)):
+            return Response(status_code=425, headers={"Retry-After": "1"})
+        return await super().get_response(path, scope)
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if os.path.basename(full_path).startswith(IMMUTABLE_PREFIXES):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+app.mount("/parts/generated", GeneratedFiles(directory=OUTPUT_DIR), name="parts")
 
 
 # ── Main ─────────────────────────────────────────────────
@@ -0,0 +1,40 @@
+"""concat_meshes must keep part colours that trimesh.util.concatenate kept."""
+
+import numpy as np
+import trimesh
+
+from server import concat_meshes
+
+
+def _box(face_color=None, vertex_color=None) -> trimesh.Trimesh:
+    box = trimesh.creation.box()
+    if face_color is not None:
+        box.visual.face_colors = face_color
+    if vertex_color is not None:
+        box.visual.vertex_colors = vertex_color
+    return box
+
+
+def test_face_colors_survive_merge():
+    red, blue = _box(face_color=[255, 0, 0, 255]), _box(face_color=[0, 0, 255, 255])
+    merged = concat_meshes([red, blue], np.stack([np.eye(4), np.eye(4)]))
+
+    assert merged.visual.kind == "face"
+    n = len(red.faces)
+    assert (merged.visual.face_colors[:n] == [255, 0, 0, 255]).all()
+    assert (merged.visual.face_colors[n:] == [0, 0, 255, 255]).all()
+
+
+def test_vertex_colors_survive_merge():
+    green = _box(vertex_color=[0, 255, 0, 255])
+    merged = concat_meshes([green, _box()])
+
+    assert merged.visual.kind == "vertex"
+    assert (merged.visual.vertex_colors[:len(green.vertices)] == [0, 255, 0, 255]).all()
+
+
+def test_uncoloured_merge_has_no_visuals():
+    merged = concat_meshes([_box(), _box()])
+
+    assert merged.visual.kind is None
+    assert len(merged.faces) == 2 * len(_box().faces)
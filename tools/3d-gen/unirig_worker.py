@@ -0,0 +1,74 @@
+"""
+Persistent UniRig Worker
+
+Started by server.py inside the UniRig Conda env and kept alive across /rig
+calls, so interpreter start-up, torch + CUDA init and the imports rig_bot.py
+pulls in (they stay in sys.modules) are paid once instead of per request.
+rig_bot.py itself re-runs in a fresh namespace for every job, so its own
+module globals — including any model it loads — do not carry over.
+
+Protocol (JSON lines):
+    stdout → {"status": "ready"}                      once, after start-up
+    stdin  ← {"input": "in.glb", "output": "out.glb"} one job per line
+    stdout → {"status": "ok"} | {"status": "error", "error": "..."}
+
+Each job runs rig_bot.py exactly as the CLI would (same --input/--output
+argv, run as __main__). Everything rig_bot.py or its child processes print
+goes to stderr so it can't corrupt the reply stream. Exits on stdin EOF.
+
+Usage:
+    python unirig_worker.py path/to/UniRig/rig_bot.py
+"""
+
+import json
+import os
+import runpy
+import sys
+import traceback
+
+
+def main() -> None:
+    rig_wrapper = os.path.abspath(sys.argv[1])
+
+    # Keep the real stdout for replies; point fd 1 (inherited by any child
+    # processes rig_bot.py spawns) at stderr
+    sys.stdout.flush()
+    reply = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+
+    def send(msg: dict) -> None:
+        reply.write(json.dumps(msg) + "\n")
+        reply.flush()
+
+    # rig_bot.py imports its siblings the way `python rig_bot.py` would
+    sys.path[0] = os.path.dirname(rig_wrapper)
+
+    # Pay for torch import + CUDA context creation before the first job
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.init()
+    except ImportError:
+        pass
+    send({"status": "ready"})
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        sys.argv = [rig_wrapper, f"--input={job['input']}", f"--output={job['output']}"]
+        try:
+            runpy.run_path(rig_wrapper, run_name="__main__")
+            send({"status": "ok"})
+        except SystemExit as e:
+            if e.code in (None, 0):
+                send({"status": "ok"})
+            else:
+                send({"status": "error", "error": f"rig_bot.py exited with {e.code}"})
+        except Exception:
+            send({"status": "error", "error": traceback.format_exc()})
+
+
+if __name__ == "__main__":
+    main()